@@ -11,7 +11,7 @@ from sqlkit.core.column import (
     Text,
     Time,
 )
-from sqlkit.core.factory import Table, from_config
+from sqlkit.core.factory import Table, from_config, from_config_dict
 from sqlkit.dialects import (
     AthenaTable,
     MySQLTable,
@@ -30,6 +30,7 @@ __all__ = [
     "Table",  # Factory function
     # YAML configuration
     "from_config",
+    "from_config_dict",
     "TableRegistry",
     # Data types
     "Integer",
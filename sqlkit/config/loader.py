@@ -7,15 +7,96 @@ for table definitions, with template variable expansion support.
 
 from __future__ import annotations
 
+import copy
+import functools
+import os
+import pickle
 import re
+import tempfile
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import ValidationError
 
 from sqlkit.config.schema import TablesConfig
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _disk_cache_enabled(path: str) -> bool:
+    """
+    Check whether parsed configurations may be pickled next to the file.
+
+    The disk cache is opt-in via ``SQLKIT_CONFIG_CACHE=1`` and is never
+    used for files in the temporary directory.
+    """
+    if os.environ.get("SQLKIT_CONFIG_CACHE") != "1":
+        return False
+    # Compare resolved paths, as the temporary directory may be a symlink
+    temp_dir = Path(tempfile.gettempdir()).resolve()
+    return not Path(path).resolve().is_relative_to(temp_dir)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_parsed(path: str, mtime_ns: int, size: int) -> TablesConfig:
+    """
+    Parse and validate a YAML configuration file.
+
+    Results are cached by file identity. ``mtime_ns`` and ``size`` are
+    part of the cache key so that an edited file is parsed again.
+
+    When ``SQLKIT_CONFIG_CACHE=1`` is set, the validated configuration is
+    also pickled to ``<config_file>.pkl`` together with the source file's
+    modification time and size, and reused by later processes only while
+    both still match exactly. Loading a pickle can run arbitrary code, so
+    enable the cache only where the directory holding the configuration
+    is writable by trusted users alone.
+
+    Parameters
+    ----------
+    path : str
+        Absolute path to YAML configuration file.
+    mtime_ns : int
+        File modification time in nanoseconds.
+    size : int
+        File size in bytes.
+
+    Returns
+    -------
+    TablesConfig
+        Validated configuration object.
+    """
+    use_disk_cache = _disk_cache_enabled(path)
+    cache_path = Path(path + ".pkl")
+    if use_disk_cache:
+        try:
+            cached = pickle.loads(cache_path.read_bytes())
+        except (OSError, EOFError, pickle.UnpicklingError):
+            cached = None
+        if (
+            isinstance(cached, tuple)
+            and len(cached) == 3
+            and cached[:2] == (mtime_ns, size)
+            and isinstance(cached[2], TablesConfig)
+        ):
+            return cached[2]
+
+    with open(path, encoding="utf-8") as f:
+        raw_config = yaml.load(f, Loader=_YamlSafeLoader)
+
+    config = TablesConfig(**raw_config)
+
+    if use_disk_cache:
+        try:
+            payload = (mtime_ns, size, config)
+            cache_path.write_bytes(pickle.dumps(payload, protocol=5))
+        except OSError:
+            pass
+
+    return config
+
 
 class TemplateError(Exception):
     """Raised when template variable expansion fails."""
@@ -23,6 +104,18 @@ class TemplateError(Exception):
     pass
 
 
+class _TemplateVars(dict[str, str]):
+    """Template variables that raise TemplateError for missing names."""
+
+    __slots__ = ()
+
+    def __missing__(self, key: str) -> str:
+        raise TemplateError(
+            f"Template variable '{key}' not provided. "
+            f"Available variables: {list(self.keys())}"
+        )
+
+
 class YamlLoader:
     """
     YAML configuration loader with template variable support.
@@ -32,10 +125,22 @@ class YamlLoader:
 
     Attributes
     ----------
+    config_file : Path or None
+        Configuration file, or None for loaders created with ``from_dict``.
     config : TablesConfig
         Loaded and validated configuration.
     """
 
+    __slots__ = (
+        "config_file",
+        "config",
+        "_table_dump_cache",
+        "_method_dump_cache",
+    )
+
+    # Matches {{ variable }} placeholders, capturing the variable name
+    _TEMPLATE_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
     def __init__(self, config_file: str | Path) -> None:
         """
         Initialize loader with configuration file.
@@ -52,18 +157,37 @@ class YamlLoader:
         ValidationError
             If configuration format is invalid.
         """
-        self.config_file = Path(config_file)
-        if not self.config_file.exists():
+        path = Path(config_file)
+        if not path.exists():
             raise FileNotFoundError(
                 f"Configuration file not found: {config_file}"
             )
 
-        self.config = self._load_config()
+        self.config_file: Path | None = path
+        self.config = self._load_config(path)
+        self._init_caches()
+
+    def _init_caches(self) -> None:
+        """Create the empty per-loader dump caches."""
+        self._table_dump_cache: dict[str, dict[str, Any]] = {}
+        self._method_dump_cache: dict[
+            tuple[str, str], dict[str, Any] | None
+        ] = {}
 
-    def _load_config(self) -> TablesConfig:
+    def _load_config(self, config_file: Path) -> TablesConfig:
         """
         Load and validate YAML configuration.
 
+        Parsing and validation are shared between loaders of the same
+        unchanged file; see ``clear_cache``. Each loader receives its own
+        copy of the parsed configuration, so changes made through one
+        loader are not seen by others.
+
+        Parameters
+        ----------
+        config_file : Path
+            Path to YAML configuration file.
+
         Returns
         -------
         TablesConfig
@@ -74,14 +198,16 @@ class YamlLoader:
         ValidationError
             If configuration format is invalid.
         """
-        with open(self.config_file, encoding="utf-8") as f:
-            raw_config = yaml.safe_load(f)
+        stat = config_file.stat()
+        parsed = _load_parsed(
+            str(config_file.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+        return parsed.model_copy(deep=True)
 
-        try:
-            return TablesConfig(**raw_config)
-        except ValidationError:
-            # Re-raise the original ValidationError with context
-            raise
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear parsed configurations shared between loader instances."""
+        _load_parsed.cache_clear()
 
     @classmethod
     def expand_templates(
@@ -118,6 +244,8 @@ class YamlLoader:
         def expand_value(value: Any) -> Any:
             """Recursively expand template variables in a value."""
             if isinstance(value, str):
+                if "{{" not in value:
+                    return value
                 return cls._expand_string_template(value, template_vars)
             elif isinstance(value, dict):
                 return {k: expand_value(v) for k, v in value.items()}
@@ -129,9 +257,9 @@ class YamlLoader:
         result = expand_value(config_dict)
         return result  # type: ignore[no-any-return]
 
-    @staticmethod
+    @classmethod
     def _expand_string_template(
-        template: str, template_vars: dict[str, str]
+        cls, template: str, template_vars: dict[str, str]
     ) -> str:
         """
         Expand template variables in a string.
@@ -153,23 +281,57 @@ class YamlLoader:
         TemplateError
             If required template variable is not provided.
         """
-        # Find all template variables in the string
-        pattern = r"\{\{\s*(\w+)\s*\}\}"
-        matches = re.findall(pattern, template)
+        # Most configured values are plain strings without placeholders
+        if "{{" not in template:
+            return template
+
+        format_string = cls._to_format_string(template)
+        if format_string is not None:
+            return format_string.format_map(_TemplateVars(template_vars))
 
-        result = template
-        for var_name in matches:
+        def replace(match: re.Match[str]) -> str:
+            var_name = match.group(1)
             if var_name not in template_vars:
                 raise TemplateError(
                     f"Template variable '{var_name}' not provided. "
                     f"Available variables: {list(template_vars.keys())}"
                 )
+            return template_vars[var_name]
+
+        return cls._TEMPLATE_RE.sub(replace, template)
 
-            # Replace all occurrences of this variable
-            var_pattern = r"\{\{\s*" + re.escape(var_name) + r"\s*\}\}"
-            result = re.sub(var_pattern, template_vars[var_name], result)
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _to_format_string(cls, template: str) -> str | None:
+        """
+        Translate {{ variable }} placeholders into a str.format_map string.
 
-        return result
+        Parameters
+        ----------
+        template : str
+            String that may contain {{ variable }} placeholders.
+
+        Returns
+        -------
+        str or None
+            Equivalent format string with literal braces escaped, or None
+            if a variable name cannot be used as a format field.
+        """
+        parts = []
+        position = 0
+        for match in cls._TEMPLATE_RE.finditer(template):
+            var_name = match.group(1)
+            if var_name.isdigit():
+                # format_map treats numeric fields as positional
+                return None
+            literal = template[position : match.start()]
+            parts.append(literal.replace("{", "{{").replace("}", "}}"))
+            parts.append(f"{{{var_name}}}")
+            position = match.end()
+
+        literal = template[position:]
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        return "".join(parts)
 
     def get_table_config(self, table_name: str) -> dict[str, Any]:
         """
@@ -183,15 +345,27 @@ class YamlLoader:
         Returns
         -------
         Dict[str, Any]
-            Table configuration as dictionary.
+            Table configuration as a new dictionary that the caller may
+            modify.
 
         Raises
         ------
         KeyError
             If table is not found in configuration.
         """
-        table_config = self.config.get_table_config(table_name)
-        return table_config.model_dump()
+        return copy.deepcopy(self._table_config(table_name))
+
+    def _table_config(self, table_name: str) -> dict[str, Any]:
+        """
+        Get the cached configuration dictionary for a table.
+
+        The dictionary is shared by every caller and must not be modified;
+        use ``get_table_config`` for a private copy.
+        """
+        if table_name not in self._table_dump_cache:
+            table_config = self.config.get_table_config(table_name)
+            self._table_dump_cache[table_name] = table_config.model_dump()
+        return self._table_dump_cache[table_name]
 
     def get_method_config(
         self,
@@ -215,6 +389,7 @@ class YamlLoader:
         -------
         Optional[Dict[str, Any]]
             Method configuration dictionary, or None if not configured.
+            A new dictionary is returned on every call.
 
         Raises
         ------
@@ -223,6 +398,28 @@ class YamlLoader:
         TemplateError
             If template expansion fails.
         """
+        key = (table_name, method_name)
+        if key not in self._method_dump_cache:
+            self._method_dump_cache[key] = self._dump_method_config(
+                table_name, method_name
+            )
+        method_config = self._method_dump_cache[key]
+
+        if method_config is None:
+            return None
+
+        if template_vars:
+            # Expansion builds new containers, leaving the cache untouched
+            return self.__class__.expand_templates(
+                method_config, template_vars
+            )
+
+        return copy.deepcopy(method_config)
+
+    def _dump_method_config(
+        self, table_name: str, method_name: str
+    ) -> dict[str, Any] | None:
+        """Dump method configuration without template expansion."""
         table_config = self.config.get_table_config(table_name)
 
         if not table_config.dialect_methods:
@@ -231,16 +428,7 @@ class YamlLoader:
         if method_name not in table_config.dialect_methods:
             return None
 
-        method_config = table_config.dialect_methods[
-            method_name
-        ].dict_without_none()
-
-        if template_vars:
-            method_config = self.__class__.expand_templates(
-                method_config, template_vars
-            )
-
-        return method_config
+        return table_config.dialect_methods[method_name].dict_without_none()
 
     @classmethod
     def from_file(cls, config_file: str | Path) -> YamlLoader:
@@ -258,3 +446,33 @@ class YamlLoader:
             Configured loader instance.
         """
         return cls(config_file)
+
+    @classmethod
+    def from_dict(cls, config: Mapping[str, Any]) -> YamlLoader:
+        """
+        Create loader instance from an already parsed configuration.
+
+        The dictionary has the same layout as the YAML file and is
+        validated the same way, without reading or writing any file.
+
+        Parameters
+        ----------
+        config : Mapping[str, Any]
+            Configuration dictionary with ``tables`` and optional
+            ``metadata`` sections.
+
+        Returns
+        -------
+        YamlLoader
+            Loader whose ``config_file`` is None.
+
+        Raises
+        ------
+        ValidationError
+            If configuration format is invalid.
+        """
+        loader = cls.__new__(cls)
+        loader.config_file = None
+        loader.config = TablesConfig(**config)
+        loader._init_caches()
+        return loader
@@ -7,7 +7,10 @@ created from YAML configuration files.
 
 from __future__ import annotations
 
+import copy
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
 
 from sqlkit.config.loader import YamlLoader
 from sqlkit.core.factory import Table
@@ -28,8 +31,12 @@ class TableRegistry:
         YAML configuration loader.
     _table_cache : Dict[str, SQLTable]
         Cache of created table instances.
+    _table_names : tuple[str, ...]
+        Names of the tables defined in configuration.
     """
 
+    __slots__ = ("loader", "_table_cache", "_table_names")
+
     def __init__(self, loader: YamlLoader) -> None:
         """
         Initialize registry with YAML loader.
@@ -41,6 +48,32 @@ class TableRegistry:
         """
         self.loader = loader
         self._table_cache: dict[str, SQLTable] = {}
+        self._table_names = tuple(loader.config.tables)
+
+    def get_table_config(self, table_name: str) -> dict[str, Any]:
+        """
+        Get configuration dictionary for a specific table.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Table configuration as a new dictionary that the caller may
+            modify.
+
+        Raises
+        ------
+        KeyError
+            If table is not found in configuration.
+        ValueError
+            If no dialect is specified for the table and no default_dialect
+            is available in metadata.
+        """
+        return self.loader.get_table_config(table_name)
 
     def get_table(self, table_name: str) -> SQLTable:
         """
@@ -67,11 +100,12 @@ class TableRegistry:
         ValueError
             If table configuration is invalid.
         """
-        if table_name in self._table_cache:
-            return self._table_cache[table_name]
+        table = self._table_cache.get(table_name)
+        if table is not None:
+            return table
 
-        # Get table configuration
-        table_config = self.loader.get_table_config(table_name)
+        # Get table configuration; the loader's cached dict is only read
+        table_config = self.loader._table_config(table_name)
 
         # Create table instance using factory
         table = self._create_table_from_config(table_name, table_config)
@@ -146,7 +180,9 @@ class TableRegistry:
         # Prepare table creation arguments
         table_kwargs = {
             "dialect": config["dialect"],
-            "_yaml_config": config,  # Pass config for method enhancement
+            # Pass a private copy for method enhancement so tables cannot
+            # modify the configuration cached on the loader
+            "_yaml_config": copy.deepcopy(config),
         }
 
         # Add schema if specified
@@ -171,7 +207,7 @@ class TableRegistry:
         list[str]
             List of table names defined in configuration.
         """
-        return list(self.loader.config.tables.keys())
+        return list(self._table_names)
 
     def clear_cache(self) -> None:
         """Clear the table cache, forcing recreation on next access."""
@@ -182,9 +218,17 @@ class TableRegistry:
         Reload configuration from file and clear cache.
 
         This is useful for development when configuration files are
-        being modified and you want to pick up changes.
+        being modified and you want to pick up changes. Registries created
+        with ``from_dict`` have no file to reload, so only their table
+        cache is cleared.
         """
+        if self.loader.config_file is None:
+            self.clear_cache()
+            return
+
+        YamlLoader.clear_cache()
         self.loader = YamlLoader(self.loader.config_file)
+        self._table_names = tuple(self.loader.config.tables)
         self.clear_cache()
 
     @classmethod
@@ -204,3 +248,21 @@ class TableRegistry:
         """
         loader = YamlLoader.from_file(config_file)
         return cls(loader)
+
+    @classmethod
+    def from_dict(cls, config: Mapping[str, Any]) -> TableRegistry:
+        """
+        Create registry from a configuration dictionary.
+
+        Parameters
+        ----------
+        config : Mapping[str, Any]
+            Configuration with the same layout as the YAML file.
+
+        Returns
+        -------
+        TableRegistry
+            Configured registry instance.
+        """
+        loader = YamlLoader.from_dict(config)
+        return cls(loader)
@@ -9,7 +9,31 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    TypeAdapter,
+    ValidatorFunctionWrapHandler,
+    field_validator,
+)
+
+# Validated columns keyed by their raw definition, see TableConfig.columns
+_COLUMN_POOL_MAXSIZE = 1024
+_COLUMN_POOL: dict[tuple[Any, ...], ColumnConfig] = {}
+
+
+def _column_pool_key(data: Any) -> tuple[Any, ...] | None:
+    """Return the pool key for a raw column definition, if poolable."""
+    if not isinstance(data, dict):
+        return None
+    try:
+        # Include value types so that e.g. default=1 and default=True are
+        # not treated as the same column
+        key = tuple(sorted((k, type(v).__name__, v) for k, v in data.items()))
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 
 class ColumnConfig(BaseModel):
@@ -38,8 +62,15 @@ class ColumnConfig(BaseModel):
         Whether the column auto-increments.
     default : Optional[Union[str, int, float, bool]]
         Default value for the column.
+
+    Notes
+    -----
+    Instances are immutable so that identical column definitions can be
+    shared between tables, see ``TableConfig``.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     type: str
     length: int | None = None
@@ -176,6 +207,32 @@ class TableConfig(BaseModel):
     options: dict[str, Any] | None = None
     dialect_methods: dict[str, DialectMethodConfig] | None = None
 
+    @field_validator("columns", mode="wrap")
+    @classmethod
+    def pool_columns(
+        cls, v: Any, handler: ValidatorFunctionWrapHandler
+    ) -> list[ColumnConfig]:
+        """Reuse validated columns for previously seen raw definitions."""
+        if not isinstance(v, list):
+            return handler(v)  # type: ignore[no-any-return]
+
+        keys = [_column_pool_key(item) for item in v]
+        # Pooled instances pass through validation unchanged
+        items = [
+            _COLUMN_POOL.get(key, item) if key is not None else item
+            for key, item in zip(keys, v, strict=True)
+        ]
+        columns: list[ColumnConfig] = handler(items)
+
+        for key, column in zip(keys, columns, strict=True):
+            if (
+                key is not None
+                and key not in _COLUMN_POOL
+                and len(_COLUMN_POOL) < _COLUMN_POOL_MAXSIZE
+            ):
+                _COLUMN_POOL[key] = column
+        return columns
+
     def model_post_init(self, __context: Any) -> None:
         """Apply metadata defaults after model initialization."""
         if __context and "metadata" in __context:
@@ -210,6 +267,12 @@ class TableConfig(BaseModel):
         return v
 
 
+# Validates a whole tables mapping in a single pydantic-core call
+_TABLES_ADAPTER: TypeAdapter[dict[str, TableConfig]] = TypeAdapter(
+    dict[str, TableConfig]
+)
+
+
 class MetadataConfig(BaseModel):
     """
     Global metadata configuration.
@@ -246,14 +309,14 @@ class TablesConfig(BaseModel):
         if self.metadata:
             context = {"metadata": self.metadata}
 
-            # Re-create each table config with metadata context
-            for table_name, table_config in self.tables.items():
-                # Create new instance with metadata context
-                table_data = table_config.model_dump()
-                new_table_config = TableConfig.model_validate(
-                    table_data, context=context
-                )
-                self.tables[table_name] = new_table_config
+            # Re-create all table configs with metadata context in one call
+            tables_data = {
+                table_name: table_config.model_dump()
+                for table_name, table_config in self.tables.items()
+            }
+            self.tables = _TABLES_ADAPTER.validate_python(
+                tables_data, context=context
+            )
 
     def get_table_config(self, table_name: str) -> TableConfig:
         """
@@ -9,6 +9,7 @@ configuration for table definitions.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -18,6 +19,40 @@ if TYPE_CHECKING:
     from sqlkit.core.column import Column
 
 
+class GenericSQLTable(SQLTable):
+    """Generic SQL table implementation."""
+
+    pass
+
+
+# Dialect name -> table class, filled on first use by _get_dialect_registry
+_DIALECT_REGISTRY: dict[str, type[SQLTable]] = {}
+
+
+def _get_dialect_registry() -> dict[str, type[SQLTable]]:
+    """Return the dialect registry, importing dialect classes on first use."""
+    if not _DIALECT_REGISTRY:
+        # Import here to avoid circular imports
+        from sqlkit.dialects.athena import AthenaTable
+        from sqlkit.dialects.mysql import MySQLTable
+        from sqlkit.dialects.oracle import OracleTable
+        from sqlkit.dialects.postgresql import PostgreSQLTable
+        from sqlkit.dialects.redshift import RedshiftTable
+        from sqlkit.dialects.sqlite import SQLiteTable
+
+        _DIALECT_REGISTRY.update(
+            {
+                "mysql": MySQLTable,
+                "postgresql": PostgreSQLTable,
+                "sqlite": SQLiteTable,
+                "redshift": RedshiftTable,
+                "athena": AthenaTable,
+                "oracle": OracleTable,
+            }
+        )
+    return _DIALECT_REGISTRY
+
+
 def Table(  # noqa: N802
     name: str,
     *columns: Column,
@@ -85,45 +120,17 @@ def Table(  # noqa: N802
     ...     engine="InnoDB"
     ... )
     """
-    # Import here to avoid circular imports
-    if dialect == "mysql":
-        from sqlkit.dialects.mysql import MySQLTable
-
-        return MySQLTable(name, *columns, schema=schema, **kwargs)
-    elif dialect == "postgresql":
-        from sqlkit.dialects.postgresql import PostgreSQLTable
-
-        return PostgreSQLTable(name, *columns, schema=schema, **kwargs)
-    elif dialect == "sqlite":
-        from sqlkit.dialects.sqlite import SQLiteTable
-
-        return SQLiteTable(name, *columns, schema=schema, **kwargs)
-    elif dialect == "redshift":
-        from sqlkit.dialects.redshift import RedshiftTable
-
-        return RedshiftTable(name, *columns, schema=schema, **kwargs)
-    elif dialect == "athena":
-        from sqlkit.dialects.athena import AthenaTable
-
-        return AthenaTable(name, *columns, schema=schema, **kwargs)
-    elif dialect == "oracle":
-        from sqlkit.dialects.oracle import OracleTable
-
-        return OracleTable(name, *columns, schema=schema, **kwargs)
-    elif dialect is None:
-        # Create a concrete SQLTable class for generic usage
-        class GenericSQLTable(SQLTable):
-            """Generic SQL table implementation."""
-
-            pass
-
+    if dialect is None:
         return GenericSQLTable(name, *columns, schema=schema, **kwargs)
-    else:
+
+    registry = _get_dialect_registry()
+    table_cls = registry.get(dialect)
+    if table_cls is None:
         raise ValueError(
             f"Unsupported dialect: {dialect}. "
-            f"Supported dialects: mysql, postgresql, sqlite, "
-            f"redshift, athena, oracle"
+            f"Supported dialects: {', '.join(registry)}"
         )
+    return table_cls(name, *columns, schema=schema, **kwargs)
 
 
 # Add a class-like interface for factory methods
@@ -185,6 +192,53 @@ class TableFactory:
         registry = TableRegistry.from_file(config_file)
         return registry.get_table(table_name)
 
+    @staticmethod
+    def from_config_dict(
+        table_name: str, config: Mapping[str, Any]
+    ) -> SQLTable:
+        """
+        Create table instance from a configuration dictionary.
+
+        The dictionary has the same layout as the YAML configuration file
+        and is validated the same way, without any file I/O.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table as defined in the configuration.
+        config : Mapping[str, Any]
+            Configuration with ``tables`` and optional ``metadata``
+            sections.
+
+        Returns
+        -------
+        SQLTable
+            Configured table instance with enhanced dialect methods.
+
+        Raises
+        ------
+        KeyError
+            If table is not defined in configuration.
+        ValueError
+            If configuration is invalid.
+
+        Examples
+        --------
+        >>> config = {
+        ...     "tables": {
+        ...         "users": {
+        ...             "dialect": "sqlite",
+        ...             "columns": [{"name": "id", "type": "int"}],
+        ...         }
+        ...     }
+        ... }
+        >>> table = TableFactory.from_config_dict("users", config)
+        """
+        from sqlkit.config.registry import TableRegistry
+
+        registry = TableRegistry.from_dict(config)
+        return registry.get_table(table_name)
+
 
 # Add convenience function at module level
 def from_config(
@@ -215,3 +269,30 @@ def from_config(
     >>> table = from_config("users", "config/tables.yaml")
     """
     return TableFactory.from_config(table_name, config_file)
+
+
+def from_config_dict(table_name: str, config: Mapping[str, Any]) -> SQLTable:
+    """
+    Create table instance from a configuration dictionary.
+
+    This is a convenience function that delegates to
+    TableFactory.from_config_dict().
+
+    Parameters
+    ----------
+    table_name : str
+        Name of the table as defined in the configuration.
+    config : Mapping[str, Any]
+        Configuration with the same layout as the YAML file.
+
+    Returns
+    -------
+    SQLTable
+        Configured table instance with enhanced dialect methods.
+
+    Examples
+    --------
+    >>> from sqlkit.core.factory import from_config_dict
+    >>> table = from_config_dict("users", {"tables": {...}})
+    """
+    return TableFactory.from_config_dict(table_name, config)
@@ -5,6 +5,7 @@ This module provides functionality to parse string-based column type
 specifications and convert them to SQLAlchemy column types.
 """
 
+import functools
 import re
 from typing import Any
 
@@ -20,6 +21,9 @@ from sqlalchemy import (
     Time,
 )
 
+# Parameterized type specification: type(param1, param2, ...)
+_PARAM_TYPE_RE = re.compile(r"^(\w+)\s*\(\s*(.*?)\s*\)$")
+
 
 class TypeParser:
     """
@@ -100,14 +104,31 @@ class TypeParser:
         if not isinstance(type_spec, str):
             return type_spec
 
-        # Parse string specification
-        return cls._parse_string_spec(type_spec)
+        # Subclasses may define their own aliases, so only the base parser
+        # shares parsed specifications
+        if cls is TypeParser:
+            base_class, args = _split_type_spec_cached(type_spec)
+        else:
+            base_class, args = cls._split_string_spec(type_spec)
+
+        # Type instances can be modified once attached to a column, so each
+        # call builds its own
+        return base_class if args is None else base_class(*args)
 
     @classmethod
-    def _parse_string_spec(cls, spec: str) -> Any:
-        """Parse a string type specification."""
+    def _split_string_spec(
+        cls, spec: str
+    ) -> tuple[Any, tuple[int, ...] | None]:
+        """
+        Split a string type specification into type class and arguments.
+
+        The arguments are None for simple types, which are used as the
+        class itself.
+        """
+        spec = spec.strip()
+
         # Check for parameterized types: type(param1, param2, ...)
-        param_match = re.match(r"^(\w+)\s*\(\s*(.*?)\s*\)$", spec.strip())
+        param_match = _PARAM_TYPE_RE.match(spec)
 
         if param_match:
             base_type = param_match.group(1)
@@ -115,7 +136,7 @@ class TypeParser:
             return cls._parse_parameterized_type(base_type, params_str)
         else:
             # Simple type without parameters
-            return cls._parse_simple_type(spec.strip())
+            return cls._parse_simple_type(spec), None
 
     @classmethod
     def _parse_simple_type(cls, type_name: str) -> Any:
@@ -128,8 +149,10 @@ class TypeParser:
             raise ValueError(f"Unknown column type: {type_name}")
 
     @classmethod
-    def _parse_parameterized_type(cls, base_type: str, params_str: str) -> Any:
-        """Parse a parameterized type specification."""
+    def _parse_parameterized_type(
+        cls, base_type: str, params_str: str
+    ) -> tuple[Any, tuple[int, ...]]:
+        """Parse a parameterized type into its class and arguments."""
         # Get the base type class with case-insensitive lookup
         normalized_base = base_type.lower()
         if normalized_base not in cls.TYPE_ALIASES:
@@ -139,7 +162,7 @@ class TypeParser:
 
         # Parse parameters
         if not params_str.strip():
-            return base_class()
+            return base_class, ()
 
         # Split parameters by comma
         params = [p.strip() for p in params_str.split(",")]
@@ -149,8 +172,7 @@ class TypeParser:
             # String types: length parameter
             if len(params) == 1:
                 try:
-                    length = int(params[0])
-                    return base_class(length)
+                    return base_class, (int(params[0]),)
                 except ValueError:
                     raise ValueError(
                         f"Invalid length parameter for {base_type}: "
@@ -165,8 +187,7 @@ class TypeParser:
             # Numeric types: precision and optional scale
             if len(params) == 1:
                 try:
-                    precision = int(params[0])
-                    return base_class(precision)
+                    return base_class, (int(params[0]),)
                 except ValueError:
                     raise ValueError(
                         f"Invalid precision parameter for {base_type}: "
@@ -174,9 +195,7 @@ class TypeParser:
                     )
             elif len(params) == 2:
                 try:
-                    precision = int(params[0])
-                    scale = int(params[1])
-                    return base_class(precision, scale)
+                    return base_class, (int(params[0]), int(params[1]))
                 except ValueError:
                     raise ValueError(
                         f"Invalid precision/scale parameters for {base_type}: "
@@ -190,14 +209,32 @@ class TypeParser:
         else:
             # For other types, just pass parameters as-is
             try:
-                int_params = [int(p) for p in params]
-                return base_class(*int_params)
+                return base_class, tuple(int(p) for p in params)
             except ValueError:
                 raise ValueError(
                     f"Invalid parameters for {base_type}: {params}"
                 )
 
 
+@functools.lru_cache(maxsize=256)
+def _split_type_spec_cached(spec: str) -> tuple[Any, tuple[int, ...] | None]:
+    """
+    Split a string type specification once.
+
+    Parameters
+    ----------
+    spec : str
+        Type specification string.
+
+    Returns
+    -------
+    tuple
+        SQLAlchemy type class and its constructor arguments, or None as
+        arguments for simple types.
+    """
+    return TypeParser._split_string_spec(spec)
+
+
 def parse_column_type(type_spec: str | type) -> Any:
     """
     Convenience function to parse column type specifications.
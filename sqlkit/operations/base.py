@@ -11,11 +11,16 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.engine import Dialect
+from sqlalchemy.engine.default import StrCompileDialect
 from sqlalchemy.sql import ClauseElement
 
 if TYPE_CHECKING:
     from sqlkit.core.table import SQLTable
 
+# SQLAlchemy creates a new dialect for every compile without one; sharing
+# a single instance also lets it keep its per-dialect type caches
+_STR_DIALECT = StrCompileDialect()
+
 
 class BaseQuery(ABC):
     """
@@ -52,6 +57,12 @@ class BaseQuery(ABC):
         -------
         ClauseElement
             SQLAlchemy query object ready for compilation.
+
+        Notes
+        -----
+        Subclasses whose statement does not depend on instance state may
+        build it once as a class attribute and return that object, as
+        ``compile`` never modifies the built query.
         """
         pass
 
@@ -73,10 +84,11 @@ class BaseQuery(ABC):
         compile_kwargs: dict[str, Any] = {"literal_binds": True}
         compile_kwargs.update(kwargs)
 
-        if self.dialect:
+        dialect = self.dialect
+        if not dialect and query.stringify_dialect == "default":
+            dialect = _STR_DIALECT
+        if dialect:
             return str(
-                query.compile(
-                    dialect=self.dialect, compile_kwargs=compile_kwargs
-                )
+                query.compile(dialect=dialect, compile_kwargs=compile_kwargs)
             )
         return str(query.compile(compile_kwargs=compile_kwargs))
@@ -42,7 +42,7 @@ class BaseTestCase:
         expected : str
             Expected substring.
         """
-        assert expected.upper() in sql.upper()
+        assert expected.casefold() in sql.casefold()
 
     def assert_sql_not_contains(self, sql: str, not_expected: str) -> None:
         """
@@ -55,7 +55,7 @@ class BaseTestCase:
         not_expected : str
             Substring that should not be present.
         """
-        assert not_expected.upper() not in sql.upper()
+        assert not_expected.casefold() not in sql.casefold()
 
     def create_test_table(
         self, table_class: type[SQLTable], table_name: str = "test_table"
@@ -99,7 +99,7 @@ class DatabaseTestMixin:
         expected : str
             Expected substring.
         """
-        assert expected.upper() in sql.upper()
+        assert expected.casefold() in sql.casefold()
 
     def assert_sql_not_contains(self, sql: str, not_expected: str) -> None:
         """
@@ -112,7 +112,7 @@ class DatabaseTestMixin:
         not_expected : str
             Substring that should not be present.
         """
-        assert not_expected.upper() not in sql.upper()
+        assert not_expected.casefold() not in sql.casefold()
 
     def test_create_table(self) -> None:
         """Test CREATE TABLE statement generation."""
@@ -5,19 +5,19 @@ This module tests that dialect-specific methods work correctly with YAML
 configuration.
 """
 
-import tempfile
-from pathlib import Path
-
 import pytest
 import yaml
 
 from sqlkit.config.registry import TableRegistry
+from sqlkit.tests.conftest import YamlDumper
+
+REDSHIFT_CREDENTIALS = "aws_iam_role=arn:aws:iam::123:role/RedshiftRole"
 
 
 class TestRedshiftYamlIntegration:
     """Test Redshift dialect with YAML configuration."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def redshift_config_dict(self):
         """Redshift configuration for testing."""
         return {
@@ -40,18 +40,14 @@ class TestRedshiftYamlIntegration:
                                 "s3://sales-bucket/{{ year }}/{{ month }}/"
                                 "data.csv"
                             ),
-                            "credentials": (
-                                "aws_iam_role=arn:aws:iam::123:role/RedshiftRole"
-                            ),
+                            "credentials": REDSHIFT_CREDENTIALS,
                             "format": "CSV",
                             "delimiter": ",",
                             "options": ["IGNOREHEADER 1", "ACCEPTINVCHARS"],
                         },
                         "unload_to_s3": {
                             "s3_path": "s3://export-bucket/sales/{{ date }}/",
-                            "credentials": (
-                                "aws_iam_role=arn:aws:iam::123:role/RedshiftRole"
-                            ),
+                            "credentials": REDSHIFT_CREDENTIALS,
                             "format": "PARQUET",
                         },
                     },
@@ -59,14 +55,15 @@ class TestRedshiftYamlIntegration:
             }
         }
 
-    @pytest.fixture
-    def redshift_config_file(self, redshift_config_dict):
+    @pytest.fixture(scope="module")
+    def redshift_config_file(self, redshift_config_dict, tmp_path_factory):
         """Create temporary Redshift config file."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            yaml.dump(redshift_config_dict, f)
-            return Path(f.name)
+        path = tmp_path_factory.mktemp("redshift") / "config.yaml"
+        path.write_text(
+            yaml.dump(redshift_config_dict, Dumper=YamlDumper),
+            encoding="utf-8",
+        )
+        return path
 
     @pytest.fixture
     def redshift_table(self, redshift_config_file):
@@ -82,55 +79,62 @@ class TestRedshiftYamlIntegration:
         assert redshift_table.dist_key == "id"
         assert redshift_table.dist_style == "KEY"
 
-    def test_copy_from_s3_with_yaml_config(self, redshift_table):
-        """Test copy_from_s3 using YAML configuration."""
-        # Test with template variables
-        template_vars = {"year": "2024", "month": "01"}
-        query = redshift_table.copy_from_s3(template_vars=template_vars)
+    @pytest.mark.parametrize(
+        "kwargs, expected, absent",
+        [
+            pytest.param(
+                {"template_vars": {"year": "2024", "month": "01"}},
+                {
+                    "s3_path": "s3://sales-bucket/2024/01/data.csv",
+                    "credentials": REDSHIFT_CREDENTIALS,
+                    "format": "CSV",
+                    "delimiter": ",",
+                    "options": ["IGNOREHEADER 1", "ACCEPTINVCHARS"],
+                },
+                (),
+                id="yaml",
+            ),
+            pytest.param(
+                {
+                    "template_vars": {"year": "2024", "month": "01"},
+                    "format": "JSON",  # Override YAML setting
+                    "delimiter": "|",  # Override YAML setting
+                },
+                {
+                    "format": "JSON",
+                    "delimiter": "|",
+                    "credentials": REDSHIFT_CREDENTIALS,  # From YAML
+                },
+                (),
+                id="override",
+            ),
+            pytest.param(
+                {
+                    "s3_path": "s3://manual-bucket/data.csv",
+                    "credentials": "manual_creds",
+                    "format": "CSV",
+                    "use_config": False,
+                },
+                {
+                    "s3_path": "s3://manual-bucket/data.csv",
+                    "credentials": "manual_creds",
+                    "format": "CSV",
+                },
+                ("options",),  # Should not have YAML options
+                id="manual",
+            ),
+        ],
+    )
+    def test_copy_from_s3(self, redshift_table, kwargs, expected, absent):
+        """Test copy_from_s3 with YAML config, overrides and manual mode."""
+        query = redshift_table.copy_from_s3(**kwargs)
 
         assert query.query_type == "COPY_FROM_S3"
         params = query.params
-        assert params["s3_path"] == "s3://sales-bucket/2024/01/data.csv"
-        assert (
-            params["credentials"]
-            == "aws_iam_role=arn:aws:iam::123:role/RedshiftRole"
-        )
-        assert params["format"] == "CSV"
-        assert params["delimiter"] == ","
-        assert params["options"] == ["IGNOREHEADER 1", "ACCEPTINVCHARS"]
-
-    def test_copy_from_s3_with_override(self, redshift_table):
-        """Test copy_from_s3 with parameter override."""
-        template_vars = {"year": "2024", "month": "01"}
-        query = redshift_table.copy_from_s3(
-            template_vars=template_vars,
-            format="JSON",  # Override YAML setting
-            delimiter="|",  # Override YAML setting
-        )
-
-        params = query.params
-        assert params["format"] == "JSON"  # Overridden
-        assert params["delimiter"] == "|"  # Overridden
-        assert (
-            params["credentials"]
-            == "aws_iam_role=arn:aws:iam::123:role/RedshiftRole"
-        )  # From YAML
-
-    def test_copy_from_s3_manual_mode(self, redshift_table):
-        """Test copy_from_s3 in manual mode."""
-        query = redshift_table.copy_from_s3(
-            s3_path="s3://manual-bucket/data.csv",
-            credentials="manual_creds",
-            format="CSV",
-            use_config=False,
-        )
-
-        params = query.params
-        assert params["s3_path"] == "s3://manual-bucket/data.csv"
-        assert params["credentials"] == "manual_creds"
-        assert params["format"] == "CSV"
-        # Should not have YAML options
-        assert "options" not in params
+        for key, value in expected.items():
+            assert params[key] == value
+        for key in absent:
+            assert key not in params
 
     def test_copy_from_s3_missing_template_var(self, redshift_table):
         """Test copy_from_s3 with missing template variable."""
@@ -165,7 +169,7 @@ class TestRedshiftYamlIntegration:
 class TestAthenaYamlIntegration:
     """Test Athena dialect with YAML configuration."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def athena_config_dict(self):
         """Athena configuration for testing."""
         return {
@@ -191,14 +195,14 @@ class TestAthenaYamlIntegration:
             }
         }
 
-    @pytest.fixture
-    def athena_config_file(self, athena_config_dict):
+    @pytest.fixture(scope="module")
+    def athena_config_file(self, athena_config_dict, tmp_path_factory):
         """Create temporary Athena config file."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            yaml.dump(athena_config_dict, f)
-            return Path(f.name)
+        path = tmp_path_factory.mktemp("athena") / "config.yaml"
+        path.write_text(
+            yaml.dump(athena_config_dict, Dumper=YamlDumper), encoding="utf-8"
+        )
+        return path
 
     @pytest.fixture
     def athena_table(self, athena_config_file):
@@ -213,37 +217,41 @@ class TestAthenaYamlIntegration:
         assert athena_table.stored_as == "PARQUET"
         assert athena_table.partition_by == ["timestamp"]
 
-    def test_msck_repair_with_yaml_config(self, athena_table):
-        """Test msck_repair using YAML configuration."""
-        query = athena_table.msck_repair()
+    @pytest.mark.parametrize(
+        "kwargs, expected, absent",
+        [
+            pytest.param({}, {"add_partitions": True}, (), id="yaml"),
+            pytest.param(
+                {"add_partitions": False},  # Override YAML setting
+                {"add_partitions": False},
+                (),
+                id="override",
+            ),
+            pytest.param(
+                {"use_config": False, "custom_option": "value"},
+                {"custom_option": "value"},
+                ("add_partitions",),  # Should not have YAML options
+                id="manual",
+            ),
+        ],
+    )
+    def test_msck_repair(self, athena_table, kwargs, expected, absent):
+        """Test msck_repair with YAML config, overrides and manual mode."""
+        query = athena_table.msck_repair(**kwargs)
 
         assert query.query_type == "MSCK_REPAIR"
         params = query.params
-        assert params["add_partitions"] is True
-
-    def test_msck_repair_with_override(self, athena_table):
-        """Test msck_repair with parameter override."""
-        query = athena_table.msck_repair(add_partitions=False)
-
-        params = query.params
-        assert params["add_partitions"] is False  # Overridden
-
-    def test_msck_repair_manual_mode(self, athena_table):
-        """Test msck_repair in manual mode."""
-        query = athena_table.msck_repair(
-            use_config=False, custom_option="value"
-        )
-
-        params = query.params
-        assert params["custom_option"] == "value"
-        # Should not have YAML options
-        assert "add_partitions" not in params
+        for key, value in expected.items():
+            assert params[key] == value
+            assert type(params[key]) is type(value)
+        for key in absent:
+            assert key not in params
 
 
 class TestMySQLYamlIntegration:
     """Test MySQL dialect with YAML configuration."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mysql_config_dict(self):
         """MySQL configuration for testing."""
         return {
@@ -271,14 +279,14 @@ class TestMySQLYamlIntegration:
             }
         }
 
-    @pytest.fixture
-    def mysql_config_file(self, mysql_config_dict):
+    @pytest.fixture(scope="module")
+    def mysql_config_file(self, mysql_config_dict, tmp_path_factory):
         """Create temporary MySQL config file."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            yaml.dump(mysql_config_dict, f)
-            return Path(f.name)
+        path = tmp_path_factory.mktemp("mysql") / "config.yaml"
+        path.write_text(
+            yaml.dump(mysql_config_dict, Dumper=YamlDumper), encoding="utf-8"
+        )
+        return path
 
     @pytest.fixture
     def mysql_table(self, mysql_config_file):
@@ -292,51 +300,65 @@ class TestMySQLYamlIntegration:
         assert mysql_table.engine_type == "InnoDB"
         assert mysql_table.charset == "utf8mb4"
 
-    def test_load_data_infile_with_yaml_config(self, mysql_table):
-        """Test load_data_infile using YAML configuration."""
-        template_vars = {"env": "prod"}
-        query = mysql_table.load_data_infile(template_vars=template_vars)
+    @pytest.mark.parametrize(
+        "kwargs, expected, absent",
+        [
+            pytest.param(
+                {"template_vars": {"env": "prod"}},
+                {
+                    "file_path": "/data/prod/products.csv",
+                    "fields_terminated_by": ",",
+                    "lines_terminated_by": "\\n",
+                    "ignore_lines": 1,
+                },
+                (),
+                id="yaml",
+            ),
+            pytest.param(
+                {
+                    "template_vars": {"env": "test"},
+                    "fields_terminated_by": "|",  # Override
+                    "ignore_lines": 0,  # Override
+                },
+                {
+                    "file_path": "/data/test/products.csv",
+                    "fields_terminated_by": "|",
+                    "ignore_lines": 0,
+                },
+                (),
+                id="override",
+            ),
+            pytest.param(
+                {
+                    "file_path": "/manual/path/data.csv",
+                    "fields_terminated_by": ";",
+                    "use_config": False,
+                },
+                {
+                    "file_path": "/manual/path/data.csv",
+                    "fields_terminated_by": ";",
+                },
+                ("lines_terminated_by",),  # Should not have YAML options
+                id="manual",
+            ),
+        ],
+    )
+    def test_load_data_infile(self, mysql_table, kwargs, expected, absent):
+        """Test load_data_infile with YAML config, overrides and manual."""
+        query = mysql_table.load_data_infile(**kwargs)
 
         assert query.query_type == "LOAD_DATA_INFILE"
         params = query.params
-        assert params["file_path"] == "/data/prod/products.csv"
-        assert params["fields_terminated_by"] == ","
-        assert params["lines_terminated_by"] == "\\n"
-        assert params["ignore_lines"] == 1
-
-    def test_load_data_infile_with_override(self, mysql_table):
-        """Test load_data_infile with parameter override."""
-        template_vars = {"env": "test"}
-        query = mysql_table.load_data_infile(
-            template_vars=template_vars,
-            fields_terminated_by="|",  # Override
-            ignore_lines=0,  # Override
-        )
-
-        params = query.params
-        assert params["file_path"] == "/data/test/products.csv"
-        assert params["fields_terminated_by"] == "|"  # Overridden
-        assert params["ignore_lines"] == 0  # Overridden
-
-    def test_load_data_infile_manual_mode(self, mysql_table):
-        """Test load_data_infile in manual mode."""
-        query = mysql_table.load_data_infile(
-            file_path="/manual/path/data.csv",
-            fields_terminated_by=";",
-            use_config=False,
-        )
-
-        params = query.params
-        assert params["file_path"] == "/manual/path/data.csv"
-        assert params["fields_terminated_by"] == ";"
-        # Should not have YAML options
-        assert "lines_terminated_by" not in params
+        for key, value in expected.items():
+            assert params[key] == value
+        for key in absent:
+            assert key not in params
 
 
 class TestFactoryIntegration:
     """Test factory integration with YAML configuration."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def factory_config_dict(self):
         """Configuration for factory testing."""
         return {
@@ -350,14 +372,14 @@ class TestFactoryIntegration:
             }
         }
 
-    @pytest.fixture
-    def factory_config_file(self, factory_config_dict):
+    @pytest.fixture(scope="module")
+    def factory_config_file(self, factory_config_dict, tmp_path_factory):
         """Create temporary config file for factory testing."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            yaml.dump(factory_config_dict, f)
-            return Path(f.name)
+        path = tmp_path_factory.mktemp("factory") / "config.yaml"
+        path.write_text(
+            yaml.dump(factory_config_dict, Dumper=YamlDumper), encoding="utf-8"
+        )
+        return path
 
     def test_from_config_function(self, factory_config_file):
         """Test from_config convenience function."""
@@ -4,7 +4,7 @@ Tests for sqlkit.config.loader module.
 This module tests YAML configuration loading and template expansion.
 """
 
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
@@ -53,17 +53,124 @@ class TestYamlLoader:
         with pytest.raises(FileNotFoundError):
             YamlLoader("nonexistent.yaml")
 
-    def test_loader_invalid_yaml(self):
+    def test_loader_invalid_yaml(self, tmp_path):
         """Test loader with invalid YAML format."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            f.write("invalid: yaml: content: [unclosed")
-            invalid_file = Path(f.name)
+        invalid_file = tmp_path / "config.yaml"
+        invalid_file.write_text("invalid: yaml: content: [unclosed")
 
         with pytest.raises((yaml.YAMLError, ValidationError)):
             YamlLoader(invalid_file)
 
+    def test_loader_copies_parsed_config(self):
+        """Test loaders of the same file get equal, independent configs."""
+        loader1 = YamlLoader(FILE / "config.yaml")
+        loader2 = YamlLoader(FILE / "config.yaml")
+
+        assert loader1.config == loader2.config
+        assert loader1.config is not loader2.config
+
+        loader1.config.tables["users"].dialect = "mysql"
+        loader3 = YamlLoader(FILE / "config.yaml")
+
+        assert loader2.config.tables["users"].dialect == "postgresql"
+        assert loader3.config.tables["users"].dialect == "postgresql"
+
+    def test_loader_reparses_modified_file(self, tmp_path):
+        """Test that editing the file invalidates the parsed config."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "tables:\n  a:\n    dialect: sqlite\n"
+            "    columns: [{name: id, type: Integer}]\n"
+        )
+        loader1 = YamlLoader(config_file)
+
+        config_file.write_text(
+            "tables:\n  bb:\n    dialect: sqlite\n"
+            "    columns: [{name: id, type: Integer}]\n"
+        )
+        loader2 = YamlLoader(config_file)
+
+        assert list(loader1.config.tables) == ["a"]
+        assert list(loader2.config.tables) == ["bb"]
+
+    def test_clear_cache(self):
+        """Test clear_cache forces a fresh parse."""
+        loader1 = YamlLoader(FILE / "config.yaml")
+        YamlLoader.clear_cache()
+        loader2 = YamlLoader(FILE / "config.yaml")
+
+        assert loader1.config is not loader2.config
+
+    def test_disk_cache(self, tmp_path, monkeypatch):
+        """Test SQLKIT_CONFIG_CACHE pickles the parsed config."""
+        monkeypatch.setenv("SQLKIT_CONFIG_CACHE", "1")
+        monkeypatch.setattr("tempfile.gettempdir", lambda: "/nonexistent")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "tables:\n  a:\n    dialect: sqlite\n"
+            "    columns: [{name: id, type: Integer}]\n"
+        )
+        loader1 = YamlLoader(config_file)
+        assert (tmp_path / "config.yaml.pkl").exists()
+
+        YamlLoader.clear_cache()
+        loader2 = YamlLoader(config_file)
+
+        assert loader2.config is not loader1.config
+        assert loader2.config == loader1.config
+
+    def test_disk_cache_ignores_older_replacement(self, tmp_path, monkeypatch):
+        """Test a replaced file with an older mtime is parsed again."""
+        monkeypatch.setenv("SQLKIT_CONFIG_CACHE", "1")
+        monkeypatch.setattr("tempfile.gettempdir", lambda: "/nonexistent")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "tables:\n  a:\n    dialect: sqlite\n"
+            "    columns: [{name: id, type: Integer}]\n"
+        )
+        YamlLoader(config_file)
+
+        # Replace the file as ``cp -p`` would, keeping an older mtime
+        mtime_ns = config_file.stat().st_mtime_ns - 10**9
+        config_file.write_text(
+            "tables:\n  bbbbb:\n    dialect: sqlite\n"
+            "    columns: [{name: id, type: Integer}]\n"
+        )
+        os.utime(config_file, ns=(mtime_ns, mtime_ns))
+        YamlLoader.clear_cache()
+
+        assert list(YamlLoader(config_file).config.tables) == ["bbbbb"]
+
+    def test_disk_cache_skips_linked_temp_dir(self, tmp_path, monkeypatch):
+        """Test the temporary directory check resolves symlinks."""
+        monkeypatch.setenv("SQLKIT_CONFIG_CACHE", "1")
+        real_dir = tmp_path / "real"
+        real_dir.mkdir()
+        link_dir = tmp_path / "link"
+        link_dir.symlink_to(real_dir)
+        monkeypatch.setattr("tempfile.gettempdir", lambda: str(link_dir))
+        config_file = real_dir / "config.yaml"
+        config_file.write_text(
+            "tables:\n  a:\n    dialect: sqlite\n"
+            "    columns: [{name: id, type: Integer}]\n"
+        )
+        YamlLoader(config_file)
+
+        assert not (real_dir / "config.yaml.pkl").exists()
+
+    def test_disk_cache_disabled_by_default(self, tmp_path, monkeypatch):
+        """Test no pickle is written unless SQLKIT_CONFIG_CACHE is set."""
+        monkeypatch.delenv("SQLKIT_CONFIG_CACHE", raising=False)
+        monkeypatch.setattr("tempfile.gettempdir", lambda: "/nonexistent")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "tables:\n  a:\n    dialect: sqlite\n"
+            "    columns: [{name: id, type: Integer}]\n"
+        )
+        YamlLoader(config_file)
+
+        assert not (tmp_path / "config.yaml.pkl").exists()
+
     def test_expand_templates_simple(self):
         """Test simple template expansion."""
 
@@ -112,6 +219,21 @@ class TestYamlLoader:
 
         assert result == expected
 
+    def test_expand_templates_does_not_modify_input(self):
+        """Test that expansion rebuilds containers instead of mutating."""
+
+        config_dict = {
+            "paths": {"input": "s3://input/{{ env }}/"},
+            "options": ["ENV={{ env }}", "STATIC"],
+        }
+
+        result = YamlLoader.expand_templates(config_dict, {"env": "prod"})
+
+        assert config_dict["paths"]["input"] == "s3://input/{{ env }}/"
+        assert config_dict["options"] == ["ENV={{ env }}", "STATIC"]
+        assert result["paths"] is not config_dict["paths"]
+        assert result["options"] is not config_dict["options"]
+
     def test_expand_templates_missing_variable(self):
         """Test template expansion with missing variable."""
 
@@ -145,6 +267,18 @@ class TestYamlLoader:
         assert len(table_config["columns"]) == 3
         assert "dialect_methods" in table_config
 
+    def test_get_table_config_returns_copy(self):
+        """Test changes to a returned table config do not reach the cache."""
+        loader = YamlLoader(FILE / "config.yaml")
+
+        table_config = loader.get_table_config("users")
+        table_config["dialect"] = "mysql"
+        table_config["columns"].clear()
+
+        fresh = loader.get_table_config("users")
+        assert fresh["dialect"] == "postgresql"
+        assert fresh["columns"]
+
     def test_get_table_config_not_found(self):
         """Test get_table_config with non-existent table."""
         fname = "config.yaml"
@@ -178,6 +312,59 @@ class TestYamlLoader:
         assert method_config["s3_path"] == "s3://bucket/users/2024-01-15/"
         assert method_config["format"] == "CSV"
 
+    def test_get_method_config_expansion_keeps_cache(self):
+        """Test template expansion does not modify the cached config."""
+        loader = YamlLoader(FILE / "config.yaml")
+
+        raw = loader.get_method_config("users", "copy_from_s3")
+        expanded = loader.get_method_config(
+            "users", "copy_from_s3", {"date": "2024-01-15"}
+        )
+
+        assert raw == loader.get_method_config("users", "copy_from_s3")
+        assert raw["s3_path"] == "s3://bucket/users/{{ date }}/"
+        assert expanded["s3_path"] == "s3://bucket/users/2024-01-15/"
+
+    def test_get_method_config_missing_template_var(self):
+        """Test get_method_config with a missing template variable."""
+        loader = YamlLoader(FILE / "config.yaml")
+
+        with pytest.raises(
+            TemplateError, match="Template variable 'date' not provided"
+        ):
+            loader.get_method_config("users", "copy_from_s3", {"env": "x"})
+
+    def test_get_method_config_returns_copy(self):
+        """Test changes to a returned method config do not reach the cache."""
+        loader = YamlLoader.from_dict(
+            {
+                "tables": {
+                    "t": {
+                        "dialect": "redshift",
+                        "columns": [{"name": "id", "type": "Integer"}],
+                        "dialect_methods": {
+                            "copy_from_s3": {
+                                "s3_path": "s3://bucket/{{ date }}/",
+                                "format": "CSV",
+                                "options": ["IGNOREHEADER 1"],
+                            }
+                        },
+                    }
+                }
+            }
+        )
+
+        method_config = loader.get_method_config("t", "copy_from_s3")
+        method_config["format"] = "JSON"
+        method_config["options"].append("X")
+
+        for template_vars in (None, {"date": "2024-01-15"}):
+            fresh = loader.get_method_config(
+                "t", "copy_from_s3", template_vars
+            )
+            assert fresh["format"] != "JSON"
+            assert "X" not in fresh["options"]
+
     def test_get_method_config_not_found(self):
         """Test get_method_config with non-existent method."""
         fname = "config.yaml"
@@ -206,24 +393,7 @@ class TestYamlLoader:
 class TestTemplateExpansion:
     """Test template expansion functionality in detail."""
 
-    @pytest.fixture
-    def sample_config_file(self):
-        """Create temporary YAML config file for template tests."""
-        config_dict = {
-            "tables": {
-                "test_table": {
-                    "dialect": "postgresql",
-                    "columns": [{"name": "id", "type": "Integer"}],
-                }
-            }
-        }
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            yaml.dump(config_dict, f)
-            return Path(f.name)
-
-    def test_expand_string_template_simple(self, sample_config_file):
+    def test_expand_string_template_simple(self):
         """Test simple string template expansion."""
 
         template = "Hello {{ name }}!"
@@ -232,7 +402,7 @@ class TestTemplateExpansion:
         result = YamlLoader._expand_string_template(template, template_vars)
         assert result == "Hello World!"
 
-    def test_expand_string_template_multiple_vars(self, sample_config_file):
+    def test_expand_string_template_multiple_vars(self):
         """Test template expansion with multiple variables."""
 
         template = "s3://{{ bucket }}/{{ env }}/{{ date }}/"
@@ -245,7 +415,7 @@ class TestTemplateExpansion:
         result = YamlLoader._expand_string_template(template, template_vars)
         assert result == "s3://data-lake/prod/2024-01-15/"
 
-    def test_expand_string_template_whitespace(self, sample_config_file):
+    def test_expand_string_template_whitespace(self):
         """Test template expansion with whitespace in placeholders."""
 
         template = "{{ name }} and {{  other_name  }}"
@@ -254,7 +424,7 @@ class TestTemplateExpansion:
         result = YamlLoader._expand_string_template(template, template_vars)
         assert result == "Alice and Bob"
 
-    def test_expand_string_template_repeated_var(self, sample_config_file):
+    def test_expand_string_template_repeated_var(self):
         """Test template expansion with repeated variables."""
 
         template = "{{ name }} likes {{ name }}"
@@ -263,7 +433,7 @@ class TestTemplateExpansion:
         result = YamlLoader._expand_string_template(template, template_vars)
         assert result == "Alice likes Alice"
 
-    def test_expand_string_template_missing_var(self, sample_config_file):
+    def test_expand_string_template_missing_var(self):
         """Test template expansion with missing variable."""
 
         template = "Hello {{ missing_var }}!"
@@ -272,3 +442,30 @@ class TestTemplateExpansion:
         msg = "Template variable 'missing_var' not provided"
         with pytest.raises(TemplateError, match=msg):
             YamlLoader._expand_string_template(template, template_vars)
+
+    def test_expand_string_template_literal_value(self):
+        """Test that backslashes in values are inserted literally."""
+
+        template = "path={{ path }}"
+        template_vars = {"path": r"C:\data\1"}
+
+        result = YamlLoader._expand_string_template(template, template_vars)
+        assert result == r"path=C:\data\1"
+
+    def test_expand_string_template_literal_braces(self):
+        """Test that braces outside placeholders are kept as-is."""
+
+        template = '{"path": "{{ path }}", "opts": {}}'
+        template_vars = {"path": "s3://bucket/"}
+
+        result = YamlLoader._expand_string_template(template, template_vars)
+        assert result == '{"path": "s3://bucket/", "opts": {}}'
+
+    def test_expand_string_template_numeric_var(self):
+        """Test template expansion with an all-digit variable name."""
+
+        template = "year={{ 2024 }}"
+        template_vars = {"2024": "leap"}
+
+        result = YamlLoader._expand_string_template(template, template_vars)
+        assert result == "year=leap"
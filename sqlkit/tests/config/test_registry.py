@@ -4,7 +4,6 @@ Tests for sqlkit.config.registry module.
 This module tests table registry functionality.
 """
 
-import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -14,6 +13,7 @@ from pydantic import ValidationError
 
 from sqlkit.config.registry import TableRegistry
 from sqlkit.core.table import SQLTable
+from sqlkit.tests.conftest import YamlDumper, assert_sql_contains_all
 
 FILE = Path(__file__).parent / "file" / "config.yaml"
 
@@ -21,9 +21,9 @@ FILE = Path(__file__).parent / "file" / "config.yaml"
 class TestTableRegistry:
     """Test TableRegistry functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def registry(self):
-        """Create TableRegistry instance."""
+        """Create TableRegistry instance shared by the tests below."""
         return TableRegistry.from_file(FILE)
 
     def test_registry_initialization(self):
@@ -63,6 +63,7 @@ class TestTableRegistry:
 
     def test_get_table_caching(self, registry):
         """Test that tables are cached."""
+        registry.clear_cache()
         table1 = registry.get_table("users")
         table2 = registry.get_table("users")
 
@@ -74,6 +75,41 @@ class TestTableRegistry:
         with pytest.raises(KeyError, match="Table 'nonexistent' not found"):
             registry.get_table("nonexistent")
 
+    def test_get_table_config(self, registry):
+        """Test registry table config matches the loader's dump."""
+        table_config = registry.get_table_config("users")
+
+        assert table_config == registry.loader.get_table_config("users")
+        assert table_config is not registry.get_table_config("users")
+
+    def test_modified_table_config_does_not_change_tables(self):
+        """Test editing a returned config does not affect built tables."""
+        registry = TableRegistry.from_file(FILE)
+        registry.loader.get_table_config("redshift_sales")["dialect"] = "mysql"
+
+        table = registry.get_table("redshift_sales")
+        assert hasattr(table, "dist_key")
+
+    def test_table_config_is_not_shared(self):
+        """Test tables do not share their config dict with the registry."""
+        registry = TableRegistry.from_file(FILE)
+        table = registry.get_table("users")
+        table._yaml_config["dialect_methods"]["injected"] = {}
+
+        config = registry.get_table_config("users")
+        assert "injected" not in config["dialect_methods"]
+
+    def test_get_table_config_missing_dialect(self, tmp_path):
+        """Test table without dialect and without default_dialect."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "tables:\n  t:\n    columns: [{name: id, type: Integer}]\n"
+        )
+        registry = TableRegistry.from_file(config_file)
+
+        with pytest.raises(ValueError, match="No dialect specified"):
+            registry.get_table("t")
+
     def test_list_tables(self, registry):
         """Test listing available tables."""
         tables = registry.list_tables()
@@ -146,7 +182,7 @@ class TestTableRegistry:
         assert table._yaml_config is not None
         assert "dialect_methods" in table._yaml_config
 
-    def test_invalid_column_type_error(self):
+    def test_invalid_column_type_error(self, tmp_path):
         """Test error handling for invalid column type."""
         # Create config with invalid column type
         invalid_config = {
@@ -163,11 +199,10 @@ class TestTableRegistry:
             }
         }
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            yaml.dump(invalid_config, f)
-            invalid_file = Path(f.name)
+        invalid_file = tmp_path / "config.yaml"
+        invalid_file.write_text(
+            yaml.dump(invalid_config, Dumper=YamlDumper), encoding="utf-8"
+        )
 
         with pytest.raises(ValidationError, match="Unsupported column type"):
             TableRegistry.from_file(invalid_file)
@@ -200,13 +235,37 @@ class TestTableRegistryIntegration:
         }
 
     @pytest.fixture
-    def integration_config_file(self, integration_config_dict):
+    def integration_config_file(self, integration_config_dict, tmp_path):
         """Create temporary config file for integration testing."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            yaml.dump(integration_config_dict, f)
-            return Path(f.name)
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            yaml.dump(integration_config_dict, Dumper=YamlDumper),
+            encoding="utf-8",
+        )
+        return path
+
+    def test_from_dict_matches_from_file(
+        self, integration_config_dict, integration_config_file
+    ):
+        """Test a dictionary config builds the same table as its file."""
+        from_dict = TableRegistry.from_dict(integration_config_dict)
+        from_file = TableRegistry.from_file(integration_config_file)
+
+        assert from_dict.loader.config_file is None
+        assert from_dict.list_tables() == from_file.list_tables()
+        assert (
+            from_dict.get_table("simple_table").create().compile()
+            == from_file.get_table("simple_table").create().compile()
+        )
+
+    def test_from_dict_reload_clears_cache(self, integration_config_dict):
+        """Test reloading a dictionary registry only clears its cache."""
+        registry = TableRegistry.from_dict(integration_config_dict)
+        table = registry.get_table("simple_table")
+
+        registry.reload_config()
+
+        assert registry.get_table("simple_table") is not table
 
     def test_end_to_end_table_creation(self, integration_config_file):
         """Test complete end-to-end table creation."""
@@ -219,10 +278,9 @@ class TestTableRegistryIntegration:
 
         # Verify we can generate SQL
         create_sql = table.create().compile()
-        assert "CREATE TABLE" in create_sql.upper()
-        assert "SIMPLE_TABLE" in create_sql.upper()
-        assert "ID" in create_sql.upper()
-        assert "NAME" in create_sql.upper()
+        assert_sql_contains_all(
+            create_sql, "CREATE TABLE", "SIMPLE_TABLE", "ID", "NAME"
+        )
 
     def test_table_operations_work(self, integration_config_file):
         """Test that table operations work correctly."""
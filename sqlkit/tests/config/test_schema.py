@@ -4,6 +4,7 @@ Tests for sqlkit.config.schema module.
 This module tests Pydantic schema validation for YAML configuration.
 """
 
+import re
 from typing import Any
 
 import pytest
@@ -18,6 +19,85 @@ from sqlkit.config.schema import (
     TablesConfig,
 )
 
+# Error patterns shared by the invalid-input tests
+_UNSUPPORTED_TYPE_RE = re.compile("Unsupported column type")
+_UNSUPPORTED_DIALECT_RE = re.compile("Unsupported dialect")
+
+VALID_TYPES = (
+    # Legacy SQLAlchemy types
+    "Integer",
+    "String",
+    "Text",
+    "Float",
+    "Numeric",
+    "Boolean",
+    "DateTime",
+    "Date",
+    "Time",
+    # TYPE_ALIASES entries
+    "int",
+    "integer",
+    "bigint",
+    "str",
+    "string",
+    "varchar",
+    "char",
+    "text",
+    "numeric",
+    "decimal",
+    "number",
+    "float",
+    "real",
+    "double",
+    "bool",
+    "boolean",
+    "date",
+    "datetime",
+    "timestamp",
+    "time",
+)
+
+VALID_DIALECTS = (
+    "mysql",
+    "postgresql",
+    "sqlite",
+    "redshift",
+    "athena",
+    "oracle",
+)
+
+
+@pytest.fixture(scope="module")
+def pg_metadata() -> MetadataConfig:
+    """Metadata defaulting to the PostgreSQL dialect."""
+    return MetadataConfig(default_dialect="postgresql")
+
+
+@pytest.fixture(scope="module")
+def mysql_metadata_dump() -> dict[str, Any]:
+    """Dumped MySQL metadata, read-only input for TablesConfig payloads."""
+    return MetadataConfig(
+        default_dialect="mysql", default_schema="default_schema"
+    ).model_dump()
+
+
+@pytest.fixture(scope="module")
+def id_int_column() -> ColumnConfig:
+    """Immutable integer ``id`` column shared by the table tests."""
+    return ColumnConfig(name="id", type="Integer")
+
+
+@pytest.fixture(scope="module")
+def table_proto(id_int_column: ColumnConfig) -> TableConfig:
+    """
+    Validated MySQL table with an ``id`` column.
+
+    Tests derive variants with ``model_copy(update=...)``, which skips
+    validation, so use it only where TableConfig validation is not under
+    test.
+    """
+    return TableConfig(dialect="mysql", columns=[id_int_column])
+
 
 class TestColumnConfig:
     """Test ColumnConfig validation."""
@@ -51,49 +131,23 @@ class TestColumnConfig:
 
     def test_invalid_column_type(self) -> None:
         """Test invalid column type raises error."""
-        with pytest.raises(ValidationError, match="Unsupported column type"):
+        with pytest.raises(ValidationError) as exc_info:
             ColumnConfig(name="test", type="InvalidType")
 
-    @pytest.mark.parametrize(
-        "valid_type",
-        [
-            # Legacy SQLAlchemy types
-            "Integer",
-            "String",
-            "Text",
-            "Float",
-            "Numeric",
-            "Boolean",
-            "DateTime",
-            "Date",
-            "Time",
-            # TYPE_ALIASES entries
-            "int",
-            "integer",
-            "bigint",
-            "str",
-            "string",
-            "varchar",
-            "char",
-            "text",
-            "numeric",
-            "decimal",
-            "number",
-            "float",
-            "real",
-            "double",
-            "bool",
-            "boolean",
-            "date",
-            "datetime",
-            "timestamp",
-            "time",
-        ],
-    )
-    def test_valid_column_types(self, valid_type: str) -> None:
+        assert _UNSUPPORTED_TYPE_RE.search(str(exc_info.value))
+
+    def test_valid_column_types(self) -> None:
         """Test all valid column types."""
-        config = ColumnConfig(name="test", type=valid_type)
-        assert config.type == valid_type
+        for valid_type in VALID_TYPES:
+            config = ColumnConfig(name="test", type=valid_type)
+            assert config.type == valid_type, valid_type
+
+    def test_column_config_is_frozen(self) -> None:
+        """Test that column configurations are immutable."""
+        config = ColumnConfig(name="id", type="Integer")
+
+        with pytest.raises(ValidationError):
+            config.name = "other"
 
     def test_numeric_with_precision_and_scale(self) -> None:
         """Test Numeric column with precision and scale."""
@@ -174,8 +228,9 @@ class TestDialectMethodConfig:
         config = DialectMethodConfig(**extra)
 
         # Extra fields should be accessible
-        assert config.model_dump()["custom_field"] == "custom_value"
-        assert config.model_dump()["another_field"] == 123
+        dumped = config.model_dump()
+        assert dumped["custom_field"] == "custom_value"
+        assert dumped["another_field"] == 123
 
     def test_dict_without_none(self) -> None:
         """Test dict_without_none method."""
@@ -215,22 +270,46 @@ class TestTableConfig:
         assert len(config.columns) == 2
         assert config.schema_name == "public"
 
-    def test_invalid_dialect(self) -> None:
+    def test_invalid_dialect(self, id_int_column: ColumnConfig) -> None:
         """Test invalid dialect raises error."""
-        columns = [ColumnConfig(name="id", type="Integer")]
+        columns = [id_int_column]
 
-        with pytest.raises(ValidationError, match="Unsupported dialect"):
+        with pytest.raises(ValidationError) as exc_info:
             TableConfig(dialect="invalid_dialect", columns=columns)
 
-    @pytest.mark.parametrize(
-        "valid_dialect",
-        ["mysql", "postgresql", "sqlite", "redshift", "athena", "oracle"],
-    )
-    def test_valid_dialects(self, valid_dialect: str) -> None:
+        assert _UNSUPPORTED_DIALECT_RE.search(str(exc_info.value))
+
+    def test_identical_columns_are_shared(self) -> None:
+        """Test identical raw column definitions share one instance."""
+        column = {"name": "id", "type": "Integer", "primary_key": True}
+
+        config1 = TableConfig.model_validate(
+            {"dialect": "mysql", "columns": [dict(column)]}
+        )
+        config2 = TableConfig.model_validate(
+            {"dialect": "sqlite", "columns": [dict(column)]}
+        )
+
+        assert config1.columns[0] is config2.columns[0]
+
+    def test_columns_with_different_value_types_not_shared(self) -> None:
+        """Test that 1 and True defaults are pooled separately."""
+        config1 = TableConfig.model_validate(
+            {"columns": [{"name": "flag", "type": "Integer", "default": 1}]}
+        )
+        config2 = TableConfig.model_validate(
+            {"columns": [{"name": "flag", "type": "Integer", "default": True}]}
+        )
+
+        assert config1.columns[0].default is not True
+        assert config2.columns[0].default is True
+
+    def test_valid_dialects(self, id_int_column: ColumnConfig) -> None:
         """Test all valid dialects."""
-        columns = [ColumnConfig(name="id", type="Integer")]
-        config = TableConfig(dialect=valid_dialect, columns=columns)
-        assert config.dialect == valid_dialect
+        columns = [id_int_column]
+        for valid_dialect in VALID_DIALECTS:
+            config = TableConfig(dialect=valid_dialect, columns=columns)
+            assert config.dialect == valid_dialect, valid_dialect
 
 
 class TestTablesConfig:
@@ -244,8 +323,12 @@ class TestTablesConfig:
         )
 
         users_columns = [
-            ColumnConfig(name="id", type="Integer", primary_key=True),
-            ColumnConfig(name="name", type="String", length=255),
+            ColumnConfig.model_construct(
+                name="id", type="Integer", primary_key=True
+            ),
+            ColumnConfig.model_construct(
+                name="name", type="String", length=255
+            ),
         ]
 
         tables = {
@@ -261,12 +344,12 @@ class TestTablesConfig:
         assert config.metadata.default_dialect == "postgresql"
         assert "users" in config.tables
 
-    def test_get_table_config(self) -> None:
+    def test_get_table_config(self, id_int_column: ColumnConfig) -> None:
         """Test get_table_config method."""
         metadata = MetadataConfig(default_dialect="mysql")
 
         users_columns = [
-            ColumnConfig(name="id", type="Integer", primary_key=True),
+            id_int_column.model_copy(update={"primary_key": True}),
         ]
 
         tables = {
@@ -290,21 +373,19 @@ class TestTablesConfig:
         with pytest.raises(KeyError, match="Table 'nonexistent' not found"):
             config.get_table_config("nonexistent")
 
-    def test_get_table_config_with_defaults(self) -> None:
+    def test_get_table_config_with_defaults(
+        self, table_proto: TableConfig
+    ) -> None:
         """Test that metadata defaults are applied."""
         metadata = MetadataConfig(
             default_dialect="mysql",
             default_schema="test_db",
         )
 
-        columns = [ColumnConfig(name="id", type="Integer")]
-
         # Table with explicit dialect and schema for testing
         tables = {
-            "test_table": TableConfig(
-                dialect="mysql",  # Use valid dialect
-                columns=columns,
-                schema_name="test_db",  # Use explicit schema
+            "test_table": table_proto.model_copy(
+                update={"schema_name": "test_db"}  # Use explicit schema
             )
         }
 
@@ -315,35 +396,30 @@ class TestTablesConfig:
         assert table_config.dialect == "mysql"
         assert table_config.schema_name == "test_db"
 
-    def test_table_config_with_none_dialect(self) -> None:
+    def test_table_config_with_none_dialect(
+        self, pg_metadata: MetadataConfig, table_proto: TableConfig
+    ) -> None:
         """Test TableConfig with None dialect (should use default)."""
-        metadata = MetadataConfig(default_dialect="postgresql")
-        columns = [ColumnConfig(name="id", type="Integer")]
-
         # Table without explicit dialect
         tables = {
-            "test_table": TableConfig(
-                dialect=None,  # Explicitly None
-                columns=columns,
+            "test_table": table_proto.model_copy(
+                update={"dialect": None}  # Explicitly None
             )
         }
 
-        config = TablesConfig(metadata=metadata, tables=tables)
+        config = TablesConfig(metadata=pg_metadata, tables=tables)
         table_config = config.get_table_config("test_table")
 
         # Should use default dialect from metadata
         assert table_config.dialect == "postgresql"
 
-    def test_table_config_missing_dialect_and_no_default(self) -> None:
+    def test_table_config_missing_dialect_and_no_default(
+        self, table_proto: TableConfig
+    ) -> None:
         """Test error when no dialect specified and no default available."""
-        columns = [ColumnConfig(name="id", type="Integer")]
-
         # Table without dialect and no metadata
         tables = {
-            "test_table": TableConfig(
-                dialect=None,
-                columns=columns,
-            )
+            "test_table": table_proto.model_copy(update={"dialect": None})
         }
 
         config = TablesConfig(tables=tables)  # No metadata with default
@@ -351,9 +427,11 @@ class TestTablesConfig:
         with pytest.raises(ValueError, match="No dialect specified"):
             config.get_table_config("test_table")
 
-    def test_table_config_creation_with_none_dialect(self) -> None:
+    def test_table_config_creation_with_none_dialect(
+        self, id_int_column: ColumnConfig
+    ) -> None:
         """Test that TableConfig can be created with None dialect."""
-        columns = [ColumnConfig(name="id", type="Integer")]
+        columns = [id_int_column]
 
         # Should not raise an error during creation
         config = TableConfig(dialect=None, columns=columns)
@@ -361,15 +439,16 @@ class TestTablesConfig:
         assert config.dialect is None
         assert len(config.columns) == 1
 
-    def test_automatic_metadata_application(self) -> None:
+    def test_automatic_metadata_application(
+        self, mysql_metadata_dump: dict[str, Any]
+    ) -> None:
         """Test that metadata defaults are automatically applied."""
-        metadata = MetadataConfig(
-            default_dialect="mysql", default_schema="test_schema"
-        )
-
         # Create TablesConfig without explicit dialect/schema in tables
         tables_data = {
-            "metadata": metadata.model_dump(),
+            "metadata": {
+                **mysql_metadata_dump,
+                "default_schema": "test_schema",
+            },
             "tables": {
                 "test_table": {
                     "columns": [{"name": "id", "type": "Integer"}]
@@ -385,14 +464,12 @@ class TestTablesConfig:
         assert table_config.dialect == "mysql"
         assert table_config.schema_name == "test_schema"
 
-    def test_explicit_values_override_metadata(self) -> None:
+    def test_explicit_values_override_metadata(
+        self, mysql_metadata_dump: dict[str, Any]
+    ) -> None:
         """Test that explicit values override metadata defaults."""
-        metadata = MetadataConfig(
-            default_dialect="mysql", default_schema="default_schema"
-        )
-
         tables_data = {
-            "metadata": metadata.model_dump(),
+            "metadata": mysql_metadata_dump,
             "tables": {
                 "test_table": {
                     "dialect": "postgresql",  # Override default
@@ -409,14 +486,12 @@ class TestTablesConfig:
         assert table_config.dialect == "postgresql"
         assert table_config.schema_name == "custom_schema"
 
-    def test_partial_metadata_application(self) -> None:
+    def test_partial_metadata_application(
+        self, mysql_metadata_dump: dict[str, Any]
+    ) -> None:
         """Test partial application when only some values are missing."""
-        metadata = MetadataConfig(
-            default_dialect="mysql", default_schema="default_schema"
-        )
-
         tables_data = {
-            "metadata": metadata.model_dump(),
+            "metadata": mysql_metadata_dump,
             "tables": {
                 "test_table": {
                     "dialect": "postgresql",  # Explicit dialect
@@ -7,16 +7,19 @@ across all test modules.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+from types import MappingProxyType
 
 import pytest
+import yaml
 
 from sqlkit.core import Column
 from sqlkit.core.column import Integer, String
+from sqlkit.core.factory import Table
 from sqlkit.core.table import SQLTable
 
-if TYPE_CHECKING:
-    pass
+# Dumper for writing test configs, libyaml-backed when PyYAML has it
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 class ConcreteSQLTable(SQLTable):
@@ -25,92 +28,60 @@ class ConcreteSQLTable(SQLTable):
     pass
 
 
-@pytest.fixture
-def sample_columns():
-    """Provide sample columns for testing."""
-    return [
-        Column("id", Integer, primary_key=True),
-        Column("name", String(255), nullable=False),
-        Column("email", String(255), unique=True),
-    ]
-
-
-@pytest.fixture
-def basic_table(sample_columns):
-    """Provide a basic table for testing."""
-    return ConcreteSQLTable("test_table", *sample_columns)
-
-
-@pytest.fixture
-def mysql_table(sample_columns):
-    """Provide a MySQL table for testing."""
-    from sqlkit.dialects.mysql import MySQLTable
-
-    return MySQLTable(
-        "test_table",
-        *sample_columns,
-        engine="InnoDB",
-        charset="utf8mb4",
-        collation="utf8mb4_unicode_ci",
+@pytest.fixture(scope="session", autouse=True)
+def _warm_pydantic_validators():
+    """Exercise the config validators once before any test runs."""
+    from sqlkit.config.schema import TablesConfig
+
+    TablesConfig.model_validate(
+        {
+            "metadata": {"default_dialect": "sqlite"},
+            "tables": {
+                "_": {
+                    "columns": [{"name": "_", "type": "Integer"}],
+                    "indexes": [{"name": "_", "columns": ["_"]}],
+                    "dialect_methods": {"_": {}},
+                }
+            },
+        }
     )
 
 
-@pytest.fixture
-def postgresql_table(sample_columns):
-    """Provide a PostgreSQL table for testing."""
-    from sqlkit.dialects.postgresql import PostgreSQLTable
-
-    return PostgreSQLTable("test_table", *sample_columns, schema="public")
-
-
-@pytest.fixture
-def sqlite_table(sample_columns):
-    """Provide a SQLite table for testing."""
-    from sqlkit.dialects.sqlite import SQLiteTable
-
-    return SQLiteTable("test_table", *sample_columns)
-
-
-@pytest.fixture
-def redshift_table(sample_columns):
-    """Provide a Redshift table for testing."""
-    from sqlkit.dialects.redshift import RedshiftTable
-
-    return RedshiftTable(
-        "test_table",
-        *sample_columns,
-        sort_keys=["id"],
-        dist_key="id",
-        dist_style="KEY",
+@pytest.fixture(scope="session")
+def _column_specs():
+    """Provide name, type and options for the sample columns."""
+    string_255 = String(255)
+    return (
+        ("id", Integer, {"primary_key": True}),
+        ("name", string_255, {"nullable": False}),
+        ("email", string_255, {"unique": True}),
     )
 
 
 @pytest.fixture
-def athena_table(sample_columns):
-    """Provide an Athena table for testing."""
-    from sqlkit.dialects.athena import AthenaTable
+def sample_columns(_column_specs):
+    """Provide fresh sample columns for testing."""
+    return [Column(name, type_, **kw) for name, type_, kw in _column_specs]
 
-    return AthenaTable(
+
+@pytest.fixture(scope="session")
+def _basic_table_proto(_column_specs):
+    """Build the basic table once per test session."""
+    return ConcreteSQLTable(
         "test_table",
-        *sample_columns,
-        location="s3://bucket/path/",
-        stored_as="PARQUET",
-        partition_by=["name"],
+        *[Column(name, type_, **kw) for name, type_, kw in _column_specs],
     )
 
 
 @pytest.fixture
-def oracle_table(sample_columns):
-    """Provide an Oracle table for testing."""
-    from sqlkit.dialects.oracle import OracleTable
+def basic_table(_basic_table_proto):
+    """
+    Provide a basic table for testing.
 
-    return OracleTable(
-        "test_table",
-        *sample_columns,
-        tablespace="USERS",
-        organization="HEAP",
-        compress=True,
-    )
+    The table is shared between tests and must not be modified; build a
+    ConcreteSQLTable from ``sample_columns`` in tests that need to.
+    """
+    return _basic_table_proto
 
 
 @pytest.fixture(
@@ -128,9 +99,9 @@ def dialect_name(request):
     return request.param
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dialect_table_classes():
-    """Provide mapping of dialect names to table classes."""
+    """Provide read-only mapping of dialect names to table classes."""
     from sqlkit.dialects.athena import AthenaTable
     from sqlkit.dialects.mysql import MySQLTable
     from sqlkit.dialects.oracle import OracleTable
@@ -138,14 +109,62 @@ def dialect_table_classes():
     from sqlkit.dialects.redshift import RedshiftTable
     from sqlkit.dialects.sqlite import SQLiteTable
 
-    return {
-        "mysql": MySQLTable,
-        "postgresql": PostgreSQLTable,
-        "sqlite": SQLiteTable,
-        "redshift": RedshiftTable,
-        "athena": AthenaTable,
-        "oracle": OracleTable,
-    }
+    return MappingProxyType(
+        {
+            "mysql": MySQLTable,
+            "postgresql": PostgreSQLTable,
+            "sqlite": SQLiteTable,
+            "redshift": RedshiftTable,
+            "athena": AthenaTable,
+            "oracle": OracleTable,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sqlite_dialect():
+    """Provide a SQLAlchemy SQLite dialect shared by compile tests."""
+    from sqlalchemy.dialects import sqlite
+
+    return sqlite.dialect()
+
+
+@pytest.fixture(scope="session")
+def mysql_dialect():
+    """Provide a SQLAlchemy MySQL dialect shared by compile tests."""
+    from sqlalchemy.dialects import mysql
+
+    return mysql.dialect()
+
+
+@pytest.fixture(scope="session")
+def postgresql_dialect():
+    """Provide a SQLAlchemy PostgreSQL dialect shared by compile tests."""
+    from sqlalchemy.dialects import postgresql
+
+    return postgresql.dialect()
+
+
+@pytest.fixture(scope="session")
+def factory_table_pool():
+    """
+    Provide factory-built tables shared across tests.
+
+    Returns a function taking ``(dialect, table_name)`` that builds an
+    ``id``/``name`` table with ``Table`` on first request and returns the
+    same instance afterwards. Pooled tables must not be modified.
+    """
+
+    @functools.cache
+    def get(dialect: str | None, table_name: str) -> SQLTable:
+        return Table(
+            table_name,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(100)),
+            dialect=dialect,
+        )
+
+    return get
 
 
 def assert_sql_contains(sql: str, expected: str) -> None:
@@ -159,7 +178,7 @@ def assert_sql_contains(sql: str, expected: str) -> None:
     expected : str
         Expected substring.
     """
-    assert expected.upper() in sql.upper()
+    assert expected.casefold() in sql.casefold()
 
 
 def assert_sql_not_contains(sql: str, not_expected: str) -> None:
@@ -173,7 +192,23 @@ def assert_sql_not_contains(sql: str, not_expected: str) -> None:
     not_expected : str
         Substring that should not be present.
     """
-    assert not_expected.upper() not in sql.upper()
+    assert not_expected.casefold() not in sql.casefold()
+
+
+def assert_sql_contains_all(sql: str, *needles: str) -> None:
+    """
+    Assert that SQL string contains every expected substring.
+
+    Parameters
+    ----------
+    sql : str
+        Generated SQL string.
+    *needles : str
+        Expected substrings.
+    """
+    folded = sql.casefold()
+    missing = [n for n in needles if n.casefold() not in folded]
+    assert not missing, f"Missing {missing} in {sql!r}"
 
 
 # Make assertion helpers available as pytest fixtures
@@ -5,6 +5,7 @@ This module tests the column definitions and data type re-exports
 from SQLAlchemy using pytest.
 """
 
+import pytest
 from sqlalchemy import Column as SQLAColumn
 from sqlalchemy.sql.sqltypes import (
     Boolean,
@@ -83,37 +84,22 @@ class TestColumn:
 class TestDataTypeReExports:
     """Test that all data types are properly re-exported."""
 
-    def test_integer_type(self):
-        """Test Integer type re-export."""
-        assert SQLKitInteger is Integer
-
-    def test_string_type(self):
-        """Test String type re-export."""
-        assert SQLKitString is String
-
-    def test_datetime_type(self):
-        """Test DateTime type re-export."""
-        assert SQLKitDateTime is DateTime
-
-    def test_boolean_type(self):
-        """Test Boolean type re-export."""
-        assert SQLKitBoolean is Boolean
-
-    def test_float_type(self):
-        """Test Float type re-export."""
-        assert SQLKitFloat is Float
-
-    def test_text_type(self):
-        """Test Text type re-export."""
-        assert SQLKitText is Text
-
-    def test_date_type(self):
-        """Test Date type re-export."""
-        assert SQLKitDate is Date
-
-    def test_time_type(self):
-        """Test Time type re-export."""
-        assert SQLKitTime is Time
+    @pytest.mark.parametrize(
+        "sqlkit_type,sqla_type",
+        [
+            (SQLKitInteger, Integer),
+            (SQLKitString, String),
+            (SQLKitDateTime, DateTime),
+            (SQLKitBoolean, Boolean),
+            (SQLKitFloat, Float),
+            (SQLKitText, Text),
+            (SQLKitDate, Date),
+            (SQLKitTime, Time),
+        ],
+    )
+    def test_type_is_reexport(self, sqlkit_type, sqla_type):
+        """Test data types are re-exported from SQLAlchemy unchanged."""
+        assert sqlkit_type is sqla_type
 
     def test_all_types_available(self):
         """Test that all expected types are available in __all__."""
@@ -131,5 +117,6 @@ class TestDataTypeReExports:
             "Time",
         ]
 
-        for expected_type in expected_types:
-            assert expected_type in __all__
+        all_set = frozenset(__all__)
+        missing = [t for t in expected_types if t not in all_set]
+        assert not missing, missing
@@ -11,29 +11,26 @@ import pytest
 
 from sqlkit.core import Column
 from sqlkit.core.column import Integer, String
-from sqlkit.core.factory import Table
+from sqlkit.core.factory import GenericSQLTable, Table
 from sqlkit.core.table import SQLTable
-from sqlkit.dialects.athena import AthenaTable
-from sqlkit.dialects.mysql import MySQLTable
-from sqlkit.dialects.oracle import OracleTable
-from sqlkit.dialects.postgresql import PostgreSQLTable
-from sqlkit.dialects.redshift import RedshiftTable
-from sqlkit.dialects.sqlite import SQLiteTable
 from sqlkit.tests.conftest import assert_sql_contains
 
+# Supported dialects; table classes come from the dialect_table_classes
+# fixture so that only the dialect modules a run needs are imported
+_DIALECTS = ("mysql", "postgresql", "sqlite", "redshift", "athena", "oracle")
+
 
 class TestTableFactory:
     """Test Table factory function."""
 
     @pytest.fixture
-    def sample_columns(self):
-        """Provide sample columns for factory testing."""
+    def sample_columns(self, _column_specs):
+        """Provide fresh id and name columns for factory testing."""
         return [
-            Column("id", Integer, primary_key=True),
-            Column("name", String(255), nullable=False),
+            Column(name, type_, **kw) for name, type_, kw in _column_specs[:2]
         ]
 
-    def test_mysql_table_creation(self, sample_columns):
+    def test_mysql_table_creation(self, sample_columns, dialect_table_classes):
         """Test MySQL table creation via factory function."""
         table = Table(
             "test_table",
@@ -43,12 +40,14 @@ class TestTableFactory:
             charset="utf8mb4",
         )
 
-        assert isinstance(table, MySQLTable)
+        assert type(table) is dialect_table_classes["mysql"]
         assert table.name == "test_table"
         assert table.engine_type == "InnoDB"
         assert table.charset == "utf8mb4"
 
-    def test_postgresql_table_creation(self, sample_columns):
+    def test_postgresql_table_creation(
+        self, sample_columns, dialect_table_classes
+    ):
         """Test PostgreSQL table creation via factory function."""
         table = Table(
             "test_table",
@@ -57,22 +56,22 @@ class TestTableFactory:
             schema="public",
         )
 
-        assert isinstance(table, PostgreSQLTable)
+        assert type(table) is dialect_table_classes["postgresql"]
         assert table.name == "test_table"
         assert table.schema == "public"
 
-    def test_sqlite_table_creation(self, sample_columns):
+    def test_sqlite_table_creation(
+        self, factory_table_pool, dialect_table_classes
+    ):
         """Test SQLite table creation via factory function."""
-        table = Table(
-            "test_table",
-            *sample_columns,
-            dialect="sqlite",
-        )
+        table = factory_table_pool("sqlite", "test_table")
 
-        assert isinstance(table, SQLiteTable)
+        assert type(table) is dialect_table_classes["sqlite"]
         assert table.name == "test_table"
 
-    def test_redshift_table_creation(self, sample_columns):
+    def test_redshift_table_creation(
+        self, sample_columns, dialect_table_classes
+    ):
         """Test Redshift table creation via factory function."""
         table = Table(
             "test_table",
@@ -83,13 +82,15 @@ class TestTableFactory:
             dist_style="KEY",
         )
 
-        assert isinstance(table, RedshiftTable)
+        assert type(table) is dialect_table_classes["redshift"]
         assert table.name == "test_table"
         assert table.sort_keys == ["id"]
         assert table.dist_key == "id"
         assert table.dist_style == "KEY"
 
-    def test_athena_table_creation(self, sample_columns):
+    def test_athena_table_creation(
+        self, sample_columns, dialect_table_classes
+    ):
         """Test Athena table creation via factory function."""
         table = Table(
             "test_table",
@@ -99,12 +100,14 @@ class TestTableFactory:
             stored_as="PARQUET",
         )
 
-        assert isinstance(table, AthenaTable)
+        assert type(table) is dialect_table_classes["athena"]
         assert table.name == "test_table"
         assert table.location == "s3://bucket/path/"
         assert table.stored_as == "PARQUET"
 
-    def test_oracle_table_creation(self, sample_columns):
+    def test_oracle_table_creation(
+        self, sample_columns, dialect_table_classes
+    ):
         """Test Oracle table creation via factory function."""
         table = Table(
             "test_table",
@@ -114,24 +117,32 @@ class TestTableFactory:
             organization="HEAP",
         )
 
-        assert isinstance(table, OracleTable)
+        assert type(table) is dialect_table_classes["oracle"]
         assert table.name == "test_table"
         assert table.tablespace == "USERS"
         assert table.organization == "HEAP"
 
-    def test_generic_table_creation(self, sample_columns):
+    def test_generic_table_creation(self, factory_table_pool):
         """Test generic table creation when dialect is None."""
-        table = Table(
-            "test_table",
-            *sample_columns,
-            dialect=None,
-        )
+        table = factory_table_pool(None, "test_table")
 
+        # Should be a generic table, not a specific dialect
+        assert type(table) is GenericSQLTable
         assert isinstance(table, SQLTable)
         assert table.name == "test_table"
-        # Should be a generic table, not a specific dialect
-        assert not isinstance(table, MySQLTable)
-        assert not isinstance(table, PostgreSQLTable)
+
+    def test_generic_table_class_is_shared(self):
+        """Test generic tables share one class across factory calls."""
+        table1 = Table("table1", Column("id", Integer))
+        table2 = Table("table2", Column("id", Integer))
+
+        assert type(table1) is type(table2)
+
+    def test_invalid_dialect_lists_supported(self, sample_columns):
+        """Test the error message lists every supported dialect."""
+        msg = "mysql, postgresql, sqlite, redshift, athena, oracle"
+        with pytest.raises(ValueError, match=msg):
+            Table("test_table", *sample_columns, dialect="invalid_dialect")
 
     def test_invalid_dialect_raises_error(self, sample_columns):
         """Test that invalid dialect raises ValueError."""
@@ -160,7 +171,7 @@ class TestTableFactory:
         insert_sql = table.insert(id=1, email="test@example.com").compile()
         assert_sql_contains(insert_sql, "INSERT INTO users")
 
-    def test_table_functionality_redshift(self):
+    def test_table_functionality_redshift(self, dialect_table_classes):
         """Test factory-created Redshift table has proper functionality."""
         table = Table(
             "products",
@@ -175,7 +186,7 @@ class TestTableFactory:
         assert_sql_contains(create_sql, "CREATE TABLE products")
 
         # Test Redshift-specific features
-        assert isinstance(table, RedshiftTable)
+        assert type(table) is dialect_table_classes["redshift"]
         copy_query = table.copy_from_s3("s3://bucket/data.csv")
         assert copy_query.query_type == "COPY_FROM_S3"
 
@@ -190,53 +201,25 @@ class TestTableFactory:
 
         assert table.schema == "analytics"
 
-    @pytest.mark.parametrize(
-        "dialect,expected_class",
-        [
-            ("mysql", MySQLTable),
-            ("postgresql", PostgreSQLTable),
-            ("sqlite", SQLiteTable),
-            ("redshift", RedshiftTable),
-            ("athena", AthenaTable),
-            ("oracle", OracleTable),
-        ],
-    )
-    def test_all_supported_dialects(self, dialect, expected_class):
-        """Test that all supported dialects can be created."""
-        # Create fresh columns for each test to avoid SQLAlchemy conflicts
-        columns = [
-            Column("id", Integer, primary_key=True),
-            Column("name", String(255), nullable=False),
-        ]
-        table = Table(
-            f"test_table_{dialect}",
-            *columns,
-            dialect=dialect,
-        )
-        assert isinstance(table, expected_class)
-        assert table.name == f"test_table_{dialect}"
-
 
 class TestTableFactoryIntegration:
     """Integration tests for Table factory function."""
 
-    def test_backward_compatibility(self):
+    def test_backward_compatibility(
+        self, factory_table_pool, dialect_table_classes
+    ):
         """Test that direct dialect class usage still works."""
         # Test that we can still use dialect classes directly
-        mysql_table = MySQLTable(
+        mysql_table = dialect_table_classes["mysql"](
             "direct_mysql",
             Column("id", Integer, primary_key=True),
         )
 
-        factory_table = Table(
-            "factory_mysql",
-            Column("id", Integer, primary_key=True),
-            dialect="mysql",
-        )
+        factory_table = factory_table_pool("mysql", "factory_mysql")
 
         # Both should be MySQL tables
-        assert isinstance(mysql_table, MySQLTable)
-        assert isinstance(factory_table, MySQLTable)
+        mysql_class = dialect_table_classes["mysql"]
+        assert type(mysql_table) is type(factory_table) is mysql_class
 
         # Both should have the same functionality
         mysql_sql = mysql_table.create().compile()
@@ -245,36 +228,20 @@ class TestTableFactoryIntegration:
         assert_sql_contains(mysql_sql, "CREATE TABLE direct_mysql")
         assert_sql_contains(factory_sql, "CREATE TABLE factory_mysql")
 
-    @pytest.mark.parametrize(
-        "dialect,expected_class",
-        [
-            ("mysql", MySQLTable),
-            ("postgresql", PostgreSQLTable),
-            ("sqlite", SQLiteTable),
-            ("redshift", RedshiftTable),
-            ("athena", AthenaTable),
-            ("oracle", OracleTable),
-        ],
-    )
-    def test_cross_dialect_functionality(self, dialect, expected_class):
+    @pytest.mark.parametrize("dialect", _DIALECTS)
+    def test_cross_dialect_functionality(
+        self, dialect, factory_table_pool, dialect_table_classes
+    ):
         """Test functionality across different dialects."""
-        # Create fresh columns for each test
-        columns = [
-            Column("id", Integer, primary_key=True),
-            Column("name", String(100)),
-        ]
-        table = Table(
-            f"test_{dialect}",
-            *columns,
-            dialect=dialect,
-        )
+        table_name = f"test_{dialect}"
+        table = factory_table_pool(dialect, table_name)
 
-        assert isinstance(table, expected_class)
+        assert type(table) is dialect_table_classes[dialect]
+        assert table.name == table_name
 
         # Test basic operations work for all dialects
         create_sql = table.create().compile()
-        assert_sql_contains(create_sql, f"CREATE TABLE test_{dialect}")
+        assert_sql_contains(create_sql, f"CREATE TABLE {table_name}")
 
         select_sql = table.select().compile()
-        assert_sql_contains(select_sql, "SELECT")
-        assert_sql_contains(select_sql, f"test_{dialect}")
+        assert_sql_contains(select_sql, f"FROM {table_name}")
@@ -6,13 +6,17 @@ This module tests the base SQLTable class functionality using pytest.
 
 from __future__ import annotations
 
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 from sqlalchemy import MetaData, Table
 
 from sqlkit.core import Column
 from sqlkit.core.column import Integer
-from sqlkit.tests.conftest import ConcreteSQLTable, assert_sql_contains
+from sqlkit.tests.conftest import (
+    ConcreteSQLTable,
+    assert_sql_contains,
+    assert_sql_contains_all,
+)
 
 
 class TestSQLTable:
@@ -41,7 +45,7 @@ class TestSQLTable:
 
     def test_table_with_dialect(self):
         """Test table initialization with dialect."""
-        mock_dialect = Mock()
+        mock_dialect = SimpleNamespace()
         table = ConcreteSQLTable(
             "test_table",
             Column("id", Integer, primary_key=True),
@@ -133,7 +137,7 @@ class TestSQLTable:
 
     def test_create_as_select_method(self, basic_table):
         """Test create_as_select method returns CTASQuery."""
-        mock_query = Mock()
+        mock_query = SimpleNamespace()
         ctas_query = basic_table.create_as_select(mock_query)
         assert ctas_query.table == basic_table
         assert ctas_query.select_query == mock_query
@@ -141,7 +145,7 @@ class TestSQLTable:
 
     def test_create_as_select_with_custom_name(self, basic_table):
         """Test create_as_select with custom table name."""
-        mock_query = Mock()
+        mock_query = SimpleNamespace()
         ctas_query = basic_table.create_as_select(
             mock_query, table_name="custom_table"
         )
@@ -160,17 +164,14 @@ class TestTableSQLGeneration:
     def test_create_table_sql(self, basic_table):
         """Test CREATE TABLE SQL generation."""
         create_sql = basic_table.create().compile()
-        assert_sql_contains(create_sql, "CREATE TABLE test_table")
-        assert_sql_contains(create_sql, "id")
-        assert_sql_contains(create_sql, "name")
-        assert_sql_contains(create_sql, "email")
+        assert_sql_contains_all(
+            create_sql, "CREATE TABLE test_table", "id", "name", "email"
+        )
 
     def test_select_sql(self, basic_table):
         """Test SELECT SQL generation."""
         select_sql = basic_table.select("name", "email").compile()
-        assert_sql_contains(select_sql, "SELECT")
-        assert_sql_contains(select_sql, "name")
-        assert_sql_contains(select_sql, "email")
+        assert_sql_contains_all(select_sql, "SELECT", "name", "email")
 
     def test_insert_sql(self, basic_table):
         """Test INSERT SQL generation."""
@@ -186,13 +187,11 @@ class TestTableSQLGeneration:
             .where(basic_table.c.id == 1)
             .compile()
         )
-        assert_sql_contains(update_sql, "UPDATE test_table")
-        assert_sql_contains(update_sql, "WHERE")
+        assert_sql_contains_all(update_sql, "UPDATE test_table", "WHERE")
 
     def test_delete_sql(self, basic_table):
         """Test DELETE SQL generation."""
         delete_sql = (
             basic_table.delete().where(basic_table.c.id == 1).compile()
         )
-        assert_sql_contains(delete_sql, "DELETE FROM test_table")
-        assert_sql_contains(delete_sql, "WHERE")
+        assert_sql_contains_all(delete_sql, "DELETE FROM test_table", "WHERE")
@@ -10,15 +10,18 @@ import pytest
 from sqlkit.core import Column
 from sqlkit.core.column import Integer, String
 from sqlkit.dialects.redshift import RedshiftTable
-from sqlkit.tests.conftest import assert_sql_contains
+from sqlkit.tests.conftest import (
+    assert_sql_contains,
+    assert_sql_contains_all,
+)
 
 
 class TestRedshiftTable:
     """Test Redshift table functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def redshift_table(self):
-        """Create a Redshift table for testing."""
+        """Create a Redshift table shared by the tests below."""
         return RedshiftTable(
             "test_table",
             Column("id", Integer, primary_key=True),
@@ -30,6 +33,21 @@ class TestRedshiftTable:
             dist_style="KEY",
         )
 
+    @pytest.fixture
+    def copy_query(self, redshift_table):
+        """Build the COPY FROM S3 query shared by the COPY tests."""
+        return redshift_table.copy_from_s3(
+            "s3://test-bucket/data.csv",
+            credentials="aws_iam_role=arn:aws:iam::123:role/TestRole",
+            format="CSV",
+            delimiter=",",
+        )
+
+    @pytest.fixture
+    def copy_sql(self, copy_query):
+        """Provide the compiled COPY FROM S3 query."""
+        return copy_query.compile()
+
     def test_table_initialization_with_redshift_options(self, redshift_table):
         """Test table initialization with Redshift-specific options."""
         assert redshift_table.name == "test_table"
@@ -37,13 +55,8 @@ class TestRedshiftTable:
         assert redshift_table.dist_key == "user_id"
         assert redshift_table.dist_style == "KEY"
 
-    def test_copy_from_s3_method(self, redshift_table):
+    def test_copy_from_s3_method(self, redshift_table, copy_query):
         """Test copy_from_s3 method."""
-        copy_query = redshift_table.copy_from_s3(
-            "s3://test-bucket/data.csv",
-            credentials="aws_iam_role=arn:aws:iam::123:role/TestRole",
-            format="CSV",
-        )
         assert copy_query.table == redshift_table
         assert copy_query.query_type == "COPY_FROM_S3"
 
@@ -74,19 +87,15 @@ class TestRedshiftTable:
         assert deep_copy_query.table == redshift_table
         assert deep_copy_query.query_type == "DEEP_COPY"
 
-    def test_copy_from_s3_sql_generation(self, redshift_table):
+    def test_copy_from_s3_sql_generation(self, copy_sql):
         """Test SQL generation for COPY FROM S3."""
-        copy_query = redshift_table.copy_from_s3(
+        assert_sql_contains_all(
+            copy_sql,
+            "COPY test_table FROM",
             "s3://test-bucket/data.csv",
-            credentials="aws_iam_role=arn:aws:iam::123:role/TestRole",
-            format="CSV",
-            delimiter=",",
+            "CREDENTIALS",
+            "FORMAT CSV",
         )
-        sql = copy_query.compile()
-        assert_sql_contains(sql, "COPY test_table FROM")
-        assert_sql_contains(sql, "s3://test-bucket/data.csv")
-        assert_sql_contains(sql, "CREDENTIALS")
-        assert_sql_contains(sql, "FORMAT CSV")
 
     def test_unload_to_s3_sql_generation(self, redshift_table):
         """Test SQL generation for UNLOAD TO S3."""
@@ -98,10 +107,13 @@ class TestRedshiftTable:
             format="PARQUET",
         )
         sql = unload_query.compile()
-        assert_sql_contains(sql, "UNLOAD")
-        assert_sql_contains(sql, "SELECT * FROM test_table WHERE id > 100")
-        assert_sql_contains(sql, "s3://test-bucket/output/")
-        assert_sql_contains(sql, "CREDENTIALS")
+        assert_sql_contains_all(
+            sql,
+            "UNLOAD",
+            "SELECT * FROM test_table WHERE id > 100",
+            "s3://test-bucket/output/",
+            "CREDENTIALS",
+        )
 
     def test_create_table_with_distribution_and_sort_keys(
         self, redshift_table
@@ -130,16 +142,12 @@ class TestRedshiftTableBasicOperations:
     def test_create_table_sql(self, sample_redshift_table):
         """Test CREATE TABLE SQL generation."""
         create_sql = sample_redshift_table.create().compile()
-        assert_sql_contains(create_sql, "CREATE TABLE users")
-        assert_sql_contains(create_sql, "id")
-        assert_sql_contains(create_sql, "name")
+        assert_sql_contains_all(create_sql, "CREATE TABLE users", "id", "name")
 
     def test_select_sql(self, sample_redshift_table):
         """Test SELECT SQL generation."""
         select_sql = sample_redshift_table.select("name").compile()
-        assert_sql_contains(select_sql, "SELECT")
-        assert_sql_contains(select_sql, "name")
-        assert_sql_contains(select_sql, "FROM users")
+        assert_sql_contains_all(select_sql, "SELECT", "name", "FROM users")
 
     def test_insert_sql(self, sample_redshift_table):
         """Test INSERT SQL generation."""
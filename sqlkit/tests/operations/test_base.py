@@ -5,7 +5,7 @@ This module tests the base query functionality and
 abstract classes using pytest.
 """
 
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 import pytest
 from sqlalchemy import text
@@ -16,9 +16,11 @@ from sqlkit.operations.base import BaseQuery
 class ConcreteQuery(BaseQuery):
     """Concrete implementation of BaseQuery for testing."""
 
+    _BUILT = text("SELECT 1")
+
     def build(self):
-        """Build a simple test query."""
-        return text("SELECT 1")
+        """Return the prebuilt test query."""
+        return self._BUILT
 
 
 class TestBaseQuery:
@@ -27,9 +29,7 @@ class TestBaseQuery:
     @pytest.fixture
     def mock_table(self):
         """Create a mock table for testing."""
-        mock_table = Mock()
-        mock_table.name = "test_table"
-        return mock_table
+        return SimpleNamespace(name="test_table")
 
     def test_base_query_initialization(self, mock_table):
         """Test BaseQuery initialization."""
@@ -39,7 +39,7 @@ class TestBaseQuery:
 
     def test_base_query_with_dialect(self, mock_table):
         """Test BaseQuery initialization with dialect."""
-        mock_dialect = Mock()
+        mock_dialect = SimpleNamespace()
         query = ConcreteQuery(mock_table, dialect=mock_dialect)
         assert query.table == mock_table
         assert query.dialect == mock_dialect
@@ -50,25 +50,30 @@ class TestBaseQuery:
             # Use type: ignore to suppress static analysis warning
             BaseQuery(mock_table)  # type: ignore[abstract]
 
-    def test_compile_method(self, mock_table):
-        """Test compile method returns SQL string."""
-        query = ConcreteQuery(mock_table)
-        sql = query.compile()
-        assert isinstance(sql, str)
-        assert "SELECT 1" in sql
-
-    def test_compile_with_kwargs(self, mock_table):
-        """Test compile method with additional kwargs."""
+    def test_build_returns_shared_statement(self, mock_table):
+        """Test compile does not require a freshly built statement."""
         query = ConcreteQuery(mock_table)
-        # This should not raise an error
-        sql = query.compile(literal_binds=False)
-        assert isinstance(sql, str)
-
-    def test_compile_with_dialect(self, mock_table):
-        """Test compile method with dialect."""
-        from sqlalchemy.dialects import sqlite
-
-        query = ConcreteQuery(mock_table, dialect=sqlite.dialect())
-        sql = query.compile()
+        assert query.build() is query.build()
+        assert query.compile() == query.compile()
+
+    @pytest.mark.parametrize(
+        "kwargs,dialect_fixture",
+        [
+            ({}, None),
+            ({"literal_binds": False}, None),
+            ({}, "sqlite_dialect"),
+            ({}, "mysql_dialect"),
+            ({}, "postgresql_dialect"),
+        ],
+    )
+    def test_compile(self, request, mock_table, kwargs, dialect_fixture):
+        """Test compile method with compile arguments and dialects."""
+        dialect = (
+            request.getfixturevalue(dialect_fixture)
+            if dialect_fixture
+            else None
+        )
+        query = ConcreteQuery(mock_table, dialect=dialect)
+        sql = query.compile(**kwargs)
         assert isinstance(sql, str)
         assert "SELECT 1" in sql
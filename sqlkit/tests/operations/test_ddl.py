@@ -6,8 +6,6 @@ This module tests DDL query functionality using pytest.
 
 from __future__ import annotations
 
-from unittest.mock import Mock
-
 import pytest
 
 from sqlkit.core import Column
@@ -18,16 +16,37 @@ from sqlkit.operations.ddl import (
     DropTableQuery,
     TruncateQuery,
 )
-from sqlkit.tests.conftest import ConcreteSQLTable, assert_sql_contains
+from sqlkit.tests.conftest import (
+    ConcreteSQLTable,
+    assert_sql_contains,
+    assert_sql_contains_all,
+)
+
+
+class _FakeSelect:
+    """Select query stand-in returning fixed SQL or raising on compile."""
+
+    __slots__ = ("_sql", "_exc")
+
+    def __init__(
+        self, sql: str | None = None, exc: Exception | None = None
+    ) -> None:
+        self._sql = sql
+        self._exc = exc
+
+    def compile(self) -> str | None:
+        if self._exc:
+            raise self._exc
+        return self._sql
 
 
 class TestDDLQueries:
     """Test DDL query classes."""
 
     @pytest.fixture
-    def table(self, sample_columns):
-        """Create a table for DDL testing."""
-        return ConcreteSQLTable("test_table", *sample_columns)
+    def table(self, basic_table):
+        """Provide the shared read-only table for DDL testing."""
+        return basic_table
 
     def test_create_table_query(self, table):
         """Test CreateTableQuery basic functionality."""
@@ -36,9 +55,7 @@ class TestDDLQueries:
         assert query.if_not_exists is False
 
         sql = query.compile()
-        assert_sql_contains(sql, "CREATE TABLE test_table")
-        assert_sql_contains(sql, "id")
-        assert_sql_contains(sql, "name")
+        assert_sql_contains_all(sql, "CREATE TABLE test_table", "id", "name")
 
     def test_create_table_query_if_not_exists(self, table):
         """Test CreateTableQuery with IF NOT EXISTS."""
@@ -75,8 +92,7 @@ class TestDDLQueries:
 
     def test_ctas_query(self, table):
         """Test CTASQuery functionality."""
-        mock_select_query = Mock()
-        mock_select_query.compile.return_value = (
+        mock_select_query = _FakeSelect(
             "SELECT * FROM source_table WHERE id > 100"
         )
 
@@ -127,8 +143,7 @@ class TestDDLQueryEdgeCases:
 
     def test_ctas_query_compilation_error_handling(self, table):
         """Test CTAS query with mock that raises error."""
-        mock_query = Mock()
-        mock_query.compile.side_effect = Exception("Compilation error")
+        mock_query = _FakeSelect(exc=Exception("Compilation error"))
 
         query = CTASQuery(table, mock_query, "error_table")
         with pytest.raises(Exception, match="Compilation error"):
@@ -5,32 +5,43 @@ This module tests the enhanced Column class and TypeParser functionality
 for string-based type specifications with various aliases.
 """
 
-import tempfile
-from pathlib import Path
-
 import pytest
 import yaml
 
-from sqlkit import Column, Integer, Numeric, String, Table, from_config
+from sqlkit import (
+    Column,
+    Integer,
+    Numeric,
+    String,
+    Table,
+    from_config,
+    from_config_dict,
+)
 from sqlkit.core.type_parser import TypeParser, parse_column_type
+from sqlkit.tests.conftest import YamlDumper, assert_sql_contains_all
 
 
 class TestTypeParser:
     """Test TypeParser functionality."""
 
-    def test_simple_type_aliases(self):
+    @pytest.mark.parametrize(
+        "type_spec,expected_type",
+        [
+            # Integer aliases
+            ("int", Integer),
+            ("integer", Integer),
+            ("INT", Integer),
+            ("Integer", Integer),
+            # String aliases
+            ("str", String),
+            ("string", String),
+            ("varchar", String),
+            ("VARCHAR", String),
+        ],
+    )
+    def test_simple_type_aliases(self, type_spec, expected_type):
         """Test simple type name aliases."""
-        # Integer aliases
-        assert TypeParser.parse_type_spec("int") == Integer
-        assert TypeParser.parse_type_spec("integer") == Integer
-        assert TypeParser.parse_type_spec("INT") == Integer
-        assert TypeParser.parse_type_spec("Integer") == Integer
-
-        # String aliases
-        assert TypeParser.parse_type_spec("str") == String
-        assert TypeParser.parse_type_spec("string") == String
-        assert TypeParser.parse_type_spec("varchar") == String
-        assert TypeParser.parse_type_spec("VARCHAR") == String
+        assert TypeParser.parse_type_spec(type_spec) == expected_type
 
     def test_string_with_length(self):
         """Test string types with length parameters."""
@@ -76,6 +87,14 @@ class TestTypeParser:
         with pytest.raises(ValueError, match="Invalid length parameter"):
             TypeParser.parse_type_spec("string(invalid)")
 
+    def test_parsed_types_are_not_shared(self):
+        """Test repeated specs build a new type instance per call."""
+        parse = TypeParser.parse_type_spec
+        first, second = parse("string(100)"), parse("string(100)")
+        assert first is not second
+        assert first.length == second.length == 100
+        assert parse("bool(1)") is not parse("bool(1)")
+
     def test_already_parsed_type(self):
         """Test that already-parsed types are returned as-is."""
         assert TypeParser.parse_type_spec(Integer) == Integer
@@ -109,21 +128,22 @@ class TestFlexibleColumn:
         assert col_num.type.precision == 18
         assert col_num.type.scale == 5
 
-    def test_column_with_various_aliases(self):
-        """Test Column creation with various type aliases."""
-        aliases_to_test = [
+    @pytest.mark.parametrize(
+        "name,type_spec,expected_type",
+        [
             ("id", "int", Integer),
             ("count", "INTEGER", Integer),
             ("name", "str", String),
             ("description", "varchar", String),
             ("amount", "decimal", Numeric),
             ("rate", "NUMERIC", Numeric),
-        ]
-
-        for name, type_spec, expected_type in aliases_to_test:
-            col = Column(name, type_spec)
-            assert col.name == name
-            assert isinstance(col.type, expected_type)
+        ],
+    )
+    def test_column_with_various_aliases(self, name, type_spec, expected_type):
+        """Test Column creation with various type aliases."""
+        col = Column(name, type_spec)
+        assert col.name == name
+        assert isinstance(col.type, expected_type)
 
 
 class TestTableWithFlexibleTypes:
@@ -142,35 +162,37 @@ class TestTableWithFlexibleTypes:
         )
 
         # Verify table creation
-        create_sql = str(table.create().compile())
-        assert "INTEGER" in create_sql.upper()
+        create_sql = table.create().compile().upper()
+        assert_sql_contains_all(
+            create_sql, "INTEGER", "NUMERIC(18, 5)", "BOOLEAN"
+        )
         assert (
-            "VARCHAR(255)" in create_sql.upper()
-            or "CHARACTER VARYING(255)" in create_sql.upper()
+            "VARCHAR(255)" in create_sql
+            or "CHARACTER VARYING(255)" in create_sql
         )
-        assert "NUMERIC(18, 5)" in create_sql.upper()
-        assert "BOOLEAN" in create_sql.upper()
 
-    def test_table_cross_dialect_compatibility(self):
+    @pytest.mark.parametrize(
+        "dialect", ["mysql", "postgresql", "sqlite", "redshift"]
+    )
+    def test_table_cross_dialect_compatibility(self, dialect):
         """Test that flexible types work across dialects."""
-        for dialect in ["mysql", "postgresql", "sqlite", "redshift"]:
-            table = Table(
-                "test_table",
-                Column("id", "int", primary_key=True),
-                Column("name", "string(100)"),
-                Column("amount", "numeric(10,2)"),
-                dialect=dialect,
-            )
+        table = Table(
+            "test_table",
+            Column("id", "int", primary_key=True),
+            Column("name", "string(100)"),
+            Column("amount", "numeric(10,2)"),
+            dialect=dialect,
+        )
 
-            # Should generate SQL without errors
-            create_sql = str(table.create().compile())
-            assert len(create_sql) > 0
+        # Should generate SQL without errors
+        create_sql = table.create().compile()
+        assert len(create_sql) > 0
 
 
 class TestYamlWithFlexibleTypes:
     """Test YAML configuration with flexible type specifications."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def flexible_types_config(self):
         """Configuration using flexible type specifications."""
         return {
@@ -198,33 +220,42 @@ class TestYamlWithFlexibleTypes:
             }
         }
 
-    @pytest.fixture
-    def flexible_config_file(self, flexible_types_config):
-        """Create temporary YAML file with flexible types."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            yaml.dump(flexible_types_config, f)
-            return Path(f.name)
+    @pytest.fixture(scope="module")
+    def flexible_config_file(self, tmp_path_factory, flexible_types_config):
+        """Create YAML file with flexible types shared by the module."""
+        path = tmp_path_factory.mktemp("cfg") / "flex.yaml"
+        path.write_text(
+            yaml.dump(flexible_types_config, Dumper=YamlDumper),
+            encoding="utf-8",
+        )
+        return path
+
+    def test_yaml_loader_smoke(
+        self, flexible_config_file, flexible_types_config
+    ):
+        """Test a YAML file builds the same table as its dictionary."""
+        from_file = from_config("users", flexible_config_file)
+        from_dict = from_config_dict("users", flexible_types_config)
+
+        assert from_file.create().compile() == from_dict.create().compile()
 
-    def test_yaml_with_flexible_types(self, flexible_config_file):
+    def test_yaml_with_flexible_types(self, flexible_types_config):
         """Test YAML configuration with flexible type aliases."""
-        table = from_config("users", flexible_config_file)
+        table = from_config_dict("users", flexible_types_config)
 
         # Verify table creation
-        create_sql = str(table.create().compile())
-        assert "INTEGER" in create_sql.upper()
+        create_sql = table.create().compile().upper()
+        assert_sql_contains_all(
+            create_sql, "INTEGER", "NUMERIC(18, 5)", "NUMERIC(10)", "BOOLEAN"
+        )
         assert (
-            "VARCHAR(255)" in create_sql.upper()
-            or "CHARACTER VARYING(255)" in create_sql.upper()
+            "VARCHAR(255)" in create_sql
+            or "CHARACTER VARYING(255)" in create_sql
         )
         assert (
-            "VARCHAR(100)" in create_sql.upper()
-            or "CHARACTER VARYING(100)" in create_sql.upper()
+            "VARCHAR(100)" in create_sql
+            or "CHARACTER VARYING(100)" in create_sql
         )
-        assert "NUMERIC(18, 5)" in create_sql.upper()
-        assert "NUMERIC(10)" in create_sql.upper()
-        assert "BOOLEAN" in create_sql.upper()
 
     def test_yaml_mixed_type_formats(self):
         """Test YAML with mixed old and new type formats."""
@@ -255,26 +286,16 @@ class TestYamlWithFlexibleTypes:
             }
         }
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            yaml.dump(config, f)
-            config_file = Path(f.name)
-
-        try:
-            table = from_config("mixed_table", config_file)
-            create_sql = str(table.create().compile())
-
-            # Should contain expected SQL elements
-            assert "INTEGER" in create_sql.upper()
-            assert (
-                "VARCHAR(255)" in create_sql.upper()
-                or "CHARACTER VARYING(255)" in create_sql.upper()
-            )
-            assert "NUMERIC(10, 2)" in create_sql.upper()
+        table = from_config_dict("mixed_table", config)
+        create_sql = table.create().compile().upper()
 
-        finally:
-            config_file.unlink()
+        # Should contain expected SQL elements
+        assert "INTEGER" in create_sql
+        assert (
+            "VARCHAR(255)" in create_sql
+            or "CHARACTER VARYING(255)" in create_sql
+        )
+        assert "NUMERIC(10, 2)" in create_sql
 
 
 class TestEdgeCases:
@@ -293,23 +314,14 @@ class TestEdgeCases:
             }
         }
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            yaml.dump(config, f)
-            config_file = Path(f.name)
-
-        try:
-            with pytest.raises(
-                Exception
-            ):  # Could be ValidationError or ValueError
-                from_config("invalid_table", config_file)
-        finally:
-            config_file.unlink()
-
-    def test_case_insensitive_types(self):
-        """Test that type specifications are case-insensitive."""
-        variations = [
+        with pytest.raises(
+            Exception
+        ):  # Could be ValidationError or ValueError
+            from_config_dict("invalid_table", config)
+
+    @pytest.mark.parametrize(
+        "type_spec,expected_type",
+        [
             ("int", Integer),
             ("INT", Integer),
             ("Integer", Integer),
@@ -317,23 +329,17 @@ class TestEdgeCases:
             ("STRING", String),
             ("varchar", String),
             ("VARCHAR", String),
-        ]
-
-        for type_spec, expected_type in variations:
-            parsed = parse_column_type(type_spec)
-            assert parsed == expected_type
+        ],
+    )
+    def test_case_insensitive_types(self, type_spec, expected_type):
+        """Test that type specifications are case-insensitive."""
+        assert parse_column_type(type_spec) == expected_type
 
-    def test_whitespace_handling(self):
+    @pytest.mark.parametrize(
+        "spec",
+        ["string( 100 )", "numeric( 18 , 5 )", "varchar(255)", " int "],
+    )
+    def test_whitespace_handling(self, spec):
         """Test that whitespace in type specifications is handled correctly."""
-        # Test various whitespace scenarios
-        specs_to_test = [
-            "string( 100 )",
-            "numeric( 18 , 5 )",
-            "varchar(255)",
-            " int ",
-        ]
-
-        for spec in specs_to_test:
-            # Should not raise an exception
-            parsed = parse_column_type(spec)
-            assert parsed is not None
+        # Should not raise an exception
+        assert parse_column_type(spec) is not None
@@ -5,28 +5,29 @@ This module tests Numeric type functionality across different dialects
 and configuration methods.
 """
 
-import tempfile
-from pathlib import Path
-
 import pytest
-import yaml
 
-from sqlkit import Column, Integer, Numeric, Table, from_config
+from sqlkit import Column, Integer, Numeric, Table, from_config_dict
+from sqlkit.tests.conftest import assert_sql_contains_all
+
+
+@pytest.fixture(scope="module")
+def fin_table():
+    """Provide the read-only id/amount PostgreSQL table shared by tests."""
+    return Table(
+        "financial_data",
+        Column("id", Integer, primary_key=True),
+        Column("amount", Numeric(18, 5)),
+        dialect="postgresql",
+    )
 
 
 class TestNumericTypes:
     """Test Numeric data type functionality."""
 
-    def test_numeric_with_precision_and_scale(self):
+    def test_numeric_with_precision_and_scale(self, fin_table):
         """Test Numeric type with both precision and scale."""
-        table = Table(
-            "financial_data",
-            Column("id", Integer, primary_key=True),
-            Column("amount", Numeric(18, 5)),
-            dialect="postgresql",
-        )
-
-        create_sql = str(table.create().compile())
+        create_sql = fin_table.create().compile()
         assert "NUMERIC(18, 5)" in create_sql.upper()
 
     def test_numeric_with_precision_only(self):
@@ -38,7 +39,7 @@ class TestNumericTypes:
             dialect="postgresql",
         )
 
-        create_sql = str(table.create().compile())
+        create_sql = table.create().compile()
         assert "NUMERIC(10)" in create_sql.upper()
 
     def test_numeric_without_parameters(self):
@@ -50,7 +51,7 @@ class TestNumericTypes:
             dialect="postgresql",
         )
 
-        create_sql = str(table.create().compile())
+        create_sql = table.create().compile()
         assert "NUMERIC" in create_sql.upper()
 
     @pytest.mark.parametrize(
@@ -66,7 +67,7 @@ class TestNumericTypes:
             dialect=dialect,
         )
 
-        create_sql = str(table.create().compile())
+        create_sql = table.create().compile()
         # All dialects should support some form of numeric type
         assert any(
             keyword in create_sql.upper()
@@ -77,7 +78,7 @@ class TestNumericTypes:
 class TestNumericYamlConfig:
     """Test Numeric type with YAML configuration."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def numeric_config_dict(self):
         """Sample configuration with Numeric types."""
         return {
@@ -112,37 +113,25 @@ class TestNumericYamlConfig:
             }
         }
 
-    @pytest.fixture
-    def numeric_config_file(self, numeric_config_dict):
-        """Create temporary YAML config file for Numeric testing."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            yaml.dump(numeric_config_dict, f)
-            return Path(f.name)
+    @pytest.fixture(scope="module")
+    def numeric_create_sql(self, numeric_config_dict):
+        """Compile the configured table's CREATE statement, upper-cased."""
+        table = from_config_dict("financial_data", numeric_config_dict)
+        return table.create().compile().upper()
 
-    def test_yaml_numeric_with_precision_and_scale(self, numeric_config_file):
+    def test_yaml_numeric_with_precision_and_scale(self, numeric_create_sql):
         """Test YAML-configured Numeric with precision and scale."""
-        table = from_config("financial_data", numeric_config_file)
-        create_sql = str(table.create().compile())
-
-        assert "NUMERIC(18, 5)" in create_sql.upper()
-        assert "NUMERIC(10, 4)" in create_sql.upper()
+        assert "NUMERIC(18, 5)" in numeric_create_sql
+        assert "NUMERIC(10, 4)" in numeric_create_sql
 
-    def test_yaml_numeric_with_precision_only(self, numeric_config_file):
+    def test_yaml_numeric_with_precision_only(self, numeric_create_sql):
         """Test YAML-configured Numeric with precision only."""
-        table = from_config("financial_data", numeric_config_file)
-        create_sql = str(table.create().compile())
+        assert "NUMERIC(10)" in numeric_create_sql
 
-        assert "NUMERIC(10)" in create_sql.upper()
-
-    def test_yaml_numeric_without_parameters(self, numeric_config_file):
+    def test_yaml_numeric_without_parameters(self, numeric_create_sql):
         """Test YAML-configured Numeric without parameters."""
-        table = from_config("financial_data", numeric_config_file)
-        create_sql = str(table.create().compile())
-
         # Should have at least one basic NUMERIC without parameters
-        assert "NUMERIC" in create_sql.upper()
+        assert "NUMERIC" in numeric_create_sql
 
     def test_yaml_validation_invalid_precision(self):
         """Test that invalid precision values are handled."""
@@ -161,45 +150,25 @@ class TestNumericYamlConfig:
             }
         }
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            yaml.dump(config_dict, f)
-            invalid_file = Path(f.name)
-
         # Should raise ValidationError due to invalid precision type
         with pytest.raises(
             Exception
         ):  # Could be ValidationError or ValueError
-            from_config("test_table", invalid_file)
+            from_config_dict("test_table", config_dict)
 
 
 class TestNumericEdgeCases:
     """Test edge cases for Numeric type support."""
 
-    def test_numeric_column_in_select(self):
+    def test_numeric_column_in_select(self, fin_table):
         """Test that Numeric columns work in SELECT statements."""
-        table = Table(
-            "financial_data",
-            Column("id", Integer, primary_key=True),
-            Column("amount", Numeric(18, 5)),
-            dialect="postgresql",
-        )
-
-        select_sql = str(table.select().compile())
+        select_sql = fin_table.select().compile()
         assert "amount" in select_sql
 
-    def test_numeric_column_in_where_clause(self):
+    def test_numeric_column_in_where_clause(self, fin_table):
         """Test that Numeric columns work in WHERE clauses."""
-        table = Table(
-            "financial_data",
-            Column("id", Integer, primary_key=True),
-            Column("amount", Numeric(18, 5)),
-            dialect="postgresql",
-        )
-
-        where_sql = str(
-            table.select().where(table.c.amount > 1000.50).compile()
+        where_sql = (
+            fin_table.select().where(fin_table.c.amount > 1000.50).compile()
         )
         assert "amount" in where_sql
         assert "1000.5" in where_sql or "1000.50" in where_sql
@@ -215,7 +184,7 @@ class TestNumericEdgeCases:
             dialect="postgresql",
         )
 
-        create_sql = str(table.create().compile())
-        assert "NUMERIC(10, 2)" in create_sql.upper()
-        assert "NUMERIC(5, 4)" in create_sql.upper()
-        assert "NUMERIC(3, 2)" in create_sql.upper()
+        create_sql = table.create().compile()
+        assert_sql_contains_all(
+            create_sql, "NUMERIC(10, 2)", "NUMERIC(5, 4)", "NUMERIC(3, 2)"
+        )